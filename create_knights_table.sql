@@ -1,17 +0,0 @@
-CREATE TABLE "knights" (
-	"id"	INTEGER,
-	"first_name"	TEXT,
-	"middle_name"	TEXT,
-	"last_name"	TEXT,
-	"wife"	TEXT,
-	"address"	TEXT,
-	"city"	TEXT,
-	"zipcode"	INTEGER,
-	"primary_phone"	TEXT,
-	"secondary_phone"	TEXT,
-	"email"	TEXT,
-	"deceased"	INTEGER,
-    "state" text,
-    "council" NUMERIC,
-	PRIMARY KEY("id" AUTOINCREMENT)
-)
\ No newline at end of file
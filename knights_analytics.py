@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# pylint: disable=C0301
+"""
+Knights Analytics
+
+Exports the directory database to a column store (one NumPy .npy file per
+column) and runs the common state office roll-ups over it with vectorized
+NumPy operations instead of full scans over the SQLite views.
+
+Integer columns are stored as int64 with -1 for NULL. Every other column is
+dictionary-encoded: an int32 code per row (-1 for NULL) plus a sorted array of
+the distinct values. All arrays are opened memory-mapped, so loading the store
+is immediate and only the columns a report touches are read.
+
+The manifest records the database's content version at export time (see
+knights_query_cache.content_version), and the command line re-exports before
+running a report if the database has changed since.
+
+Required packages:
+pip install numpy
+
+Usage:
+python knights_analytics.py --export
+python knights_analytics.py --report members
+python knights_analytics.py --columns ok_knights_directory.columns --report vacancies
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+from knights_query_cache import content_version
+
+EXPORT_TABLES = ['knights', 'councils', 'districts', 'knights_roles', 'roles', 'AgentsView']
+
+NULL = -1
+
+# per_agent key for agents with no name
+UNNAMED_AGENT = '[no name]'
+
+
+def _is_integer_column(values):
+    """True if every non-NULL value is an integer"""
+    return all(isinstance(v, int) for v in values if v is not None)
+
+
+def export_columns(db_path, out_dir, tables=None):
+    """Write every column of tables to out_dir as .npy arrays"""
+    os.makedirs(out_dir, exist_ok=True)
+    # Taken before reading, so a write during the export makes the store stale
+    version = content_version(db_path)
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'view')")
+    existing = {row[0] for row in cursor.fetchall()}
+
+    manifest = {'database': db_path, 'content_version': list(version), 'tables': {}}
+    for table in tables or EXPORT_TABLES:
+        if table not in existing:
+            print(f"Skipping missing table: {table}")
+            continue
+
+        cursor.execute(f'SELECT * FROM "{table}"')
+        names = [d[0] for d in cursor.description]
+        columns = list(zip(*cursor.fetchall())) or [()] * len(names)
+
+        manifest['tables'][table] = {}
+        for name, values in zip(names, columns):
+            base = os.path.join(out_dir, f"{table}.{name}")
+            if _is_integer_column(values):
+                data = np.array([NULL if v is None else v for v in values], dtype=np.int64)
+                np.save(f"{base}.npy", data)
+                manifest['tables'][table][name] = 'int'
+            else:
+                text = ['' if v is None else str(v) for v in values]
+                dictionary, codes = np.unique(np.array(text, dtype=str), return_inverse=True)
+                codes = codes.astype(np.int32)
+                codes[np.array([v is None for v in values], dtype=bool)] = NULL
+                np.save(f"{base}.npy", codes)
+                np.save(f"{base}.dict.npy", dictionary)
+                manifest['tables'][table][name] = 'text'
+
+        print(f"Exported {table}: {len(columns[0]) if columns else 0} rows, {len(names)} columns")
+
+    conn.close()
+
+    with open(os.path.join(out_dir, 'manifest.json'), 'w', encoding='utf-8') as manifest_file:
+        json.dump(manifest, manifest_file, indent=2)
+
+    return manifest
+
+
+class ColumnStore:
+    """Class to run vectorized reports over an exported column store"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, 'manifest.json'), 'r', encoding='utf-8') as manifest_file:
+            self.manifest = json.load(manifest_file)
+        self.tables = self.manifest.get('tables', {})
+        self._arrays = {}
+
+    def is_current(self, db_path):
+        """True if the store was exported from db_path's current content"""
+        version = self.manifest.get('content_version')
+        return version is not None and tuple(version) == content_version(db_path)
+
+    def has(self, table, column):
+        """True if the column was exported"""
+        return column in self.tables.get(table, {})
+
+    def column(self, table, column):
+        """Raw column array (codes for text columns), memory-mapped"""
+        key = f"{table}.{column}"
+        if key not in self._arrays:
+            self._arrays[key] = np.load(os.path.join(self.path, f"{key}.npy"), mmap_mode='r')
+        return self._arrays[key]
+
+    def dictionary(self, table, column):
+        """Distinct values of a dictionary-encoded text column"""
+        key = f"{table}.{column}.dict"
+        if key not in self._arrays:
+            self._arrays[key] = np.load(os.path.join(self.path, f"{key}.npy"), mmap_mode='r')
+        return self._arrays[key]
+
+    def numeric(self, table, column):
+        """Column as int64 with -1 for NULL, decoding text columns that hold numbers"""
+        if self.tables[table][column] == 'int':
+            return np.asarray(self.column(table, column))
+
+        lookup = np.array([int(float(v)) if v.strip().lstrip('-').replace('.', '', 1).isdigit() else NULL
+                           for v in self.dictionary(table, column)] + [NULL], dtype=np.int64)
+        # code -1 (NULL) indexes the trailing NULL entry
+        return lookup[self.column(table, column)]
+
+    def _labels(self, table, column):
+        """Distinct non-NULL values of a column as strings, and each row's index into them (-1 for NULL)"""
+        values = np.asarray(self.column(table, column), dtype=np.int64)
+        if self.tables[table][column] == 'text':
+            return self.dictionary(table, column).tolist(), values
+
+        distinct, inverse = np.unique(values, return_inverse=True)
+        labels = [str(v) for v in distinct.tolist()]
+        return labels, np.where(values == NULL, NULL, inverse.reshape(values.shape))
+
+    def _living(self):
+        """Boolean mask of knights not marked deceased"""
+        deceased = self.numeric('knights', 'deceased')
+        return deceased != 1
+
+    def members_per_council(self):
+        """{council_number: living members}"""
+        council = self.numeric('knights', 'council')
+        council = council[self._living() & (council != NULL)]
+        numbers, counts = np.unique(council, return_counts=True)
+        return dict(zip(numbers.tolist(), counts.tolist()))
+
+    def members_per_district(self):
+        """{district_number: living members}, joining knights to councils by council_number"""
+        council_numbers = self.numeric('councils', 'council_number')
+        district_ids = self.numeric('councils', 'district_id')
+        district_number = self._district_numbers(district_ids)
+
+        if not len(council_numbers):
+            return {}
+
+        order = np.argsort(council_numbers)
+        council = self.numeric('knights', 'council')[self._living()]
+        pos = np.clip(np.searchsorted(council_numbers[order], council), 0, len(order) - 1)
+        matched = council_numbers[order][pos] == council
+
+        districts = district_number[order][pos][matched]
+        districts = districts[districts != NULL]
+        numbers, counts = np.unique(districts, return_counts=True)
+        return dict(zip(numbers.tolist(), counts.tolist()))
+
+    def _district_numbers(self, district_ids):
+        """Map districts.id values to districts.number (-1 if unknown)"""
+        ids = self.numeric('districts', 'id')
+        numbers = self.numeric('districts', 'number')
+        if not len(ids):
+            return np.full(len(district_ids), NULL, dtype=np.int64)
+
+        order = np.argsort(ids)
+        pos = np.clip(np.searchsorted(ids[order], district_ids), 0, len(order) - 1)
+        found = ids[order][pos] == district_ids
+        return np.where(found, numbers[order][pos], NULL)
+
+    def vacancy_rates(self):
+        """Per district: council count and share of councils without a GK or FS, plus DD vacancy"""
+        district_ids = self.numeric('councils', 'district_id')
+        district_number = self._district_numbers(district_ids)
+        numbers, inverse = np.unique(district_number, return_inverse=True)
+        totals = np.bincount(inverse, minlength=len(numbers))
+
+        report = {int(n): {'councils': int(t)} for n, t in zip(numbers, totals)}
+        for officer in ('gk_id', 'fs_id'):
+            if not self.has('councils', officer):
+                continue
+            vacant = np.bincount(inverse, weights=self.numeric('councils', officer) == NULL, minlength=len(numbers))
+            for n, v, t in zip(numbers, vacant, totals):
+                report[int(n)][f"{officer[:2]}_vacancy_rate"] = float(v / t)
+
+        dd_vacant = self.numeric('districts', 'dd_id') == NULL
+        for n, vacant in zip(self.numeric('districts', 'number'), dd_vacant):
+            report.setdefault(int(n), {'councils': 0})['dd_vacant'] = bool(vacant)
+
+        report.pop(NULL, None)
+        return report
+
+    def agent_coverage(self):
+        """Councils represented per agent, and councils no agent covers"""
+        if not self.has('AgentsView', 'councils_represented'):
+            return {'per_agent': {}, 'uncovered': []}
+
+        # Split each distinct councils_represented value once, not once per row
+        dictionary = self.dictionary('AgentsView', 'councils_represented')
+        split = [[int(c) for c in v.split(',') if c.strip().isdigit()] for v in dictionary]
+        counts = np.array([len(s) for s in split] + [0], dtype=np.int64)
+
+        # The agent's name is the view's first column. Rows are summed per
+        # name (an agent can be listed under several roles), counting each
+        # distinct councils_represented value once; NULL names share one entry.
+        name_column = next(iter(self.tables['AgentsView']))
+        names, name_codes = self._labels('AgentsView', name_column)
+        names.append(UNNAMED_AGENT)
+        name_codes = np.where(name_codes == NULL, len(names) - 1, name_codes)
+
+        codes = np.asarray(self.column('AgentsView', 'councils_represented'), dtype=np.int64)
+        pairs = np.unique(name_codes * len(counts) + codes % len(counts))
+        totals = np.bincount(pairs // len(counts), weights=counts[pairs % len(counts)], minlength=len(names))
+        listed = np.bincount(name_codes, minlength=len(names)) > 0
+        per_agent = {names[i]: int(totals[i]) for i in np.flatnonzero(listed)}
+
+        covered = np.unique(np.array([c for code in np.unique(codes) if code != NULL for c in split[code]], dtype=np.int64))
+        council_numbers = self.numeric('councils', 'council_number')
+        uncovered = np.setdiff1d(council_numbers[council_numbers != NULL], covered)
+        return {'per_agent': per_agent, 'uncovered': uncovered.tolist()}
+
+
+REPORTS = {
+    'members': ColumnStore.members_per_council,
+    'districts': ColumnStore.members_per_district,
+    'vacancies': ColumnStore.vacancy_rates,
+    'agents': ColumnStore.agent_coverage
+}
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Column-store analytics for the Knights directory database')
+    parser.add_argument('--database', default='ok_knights_directory.db',
+                        help='Database file path')
+    parser.add_argument('--columns',
+                        help='Column store directory (default: <database without extension>.columns)')
+    parser.add_argument('--export', action='store_true',
+                        help='Export the database to the column store first')
+    parser.add_argument('--report', choices=sorted(REPORTS),
+                        help='Report to run')
+
+    args = parser.parse_args()
+    columns = args.columns or f"{os.path.splitext(args.database)[0]}.columns"
+
+    if args.export:
+        export_columns(args.database, columns)
+    elif args.report and os.path.exists(args.database):
+        manifest_path = os.path.join(columns, 'manifest.json')
+        if not os.path.exists(manifest_path):
+            print(f"No column store at {columns}; exporting")
+            export_columns(args.database, columns)
+        elif not ColumnStore(columns).is_current(args.database):
+            print(f"{args.database} has changed since {columns} was exported; re-exporting")
+            export_columns(args.database, columns)
+
+    if args.report:
+        store = ColumnStore(columns)
+        start = time.perf_counter()
+        result = REPORTS[args.report](store)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(json.dumps(result, indent=2, default=str))
+        print(f"Report '{args.report}' ran in {elapsed:.1f} ms")
+
+if __name__ == "__main__":
+    main()
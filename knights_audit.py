@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# pylint: disable=C0301
+"""
+Knights Data-Quality Audit
+
+Finds the gaps the directory generator would otherwise paper over with
+'[VACANT]', '[NO DATA]' and '[ERROR]': councils without a grand knight or
+financial secretary, districts without a district deputy, knights pointing at
+councils that do not exist, phone numbers the generator cannot format, and so
+on.
+
+Every check is a branch of a single UNION ALL query, so the whole audit is
+one round trip to the database rather than a lookup per row. The checks on
+knights share one scan of the knights table; the council, district and role
+checks each read their own (much smaller) table. Expects a database that is
+up to date with knights_migrate.py; insurance agents are checked too when
+the database has an AgentsView.
+
+Usage:
+python knights_audit.py
+python knights_audit.py --database /path/to/db.db --output audit.json
+python knights_audit.py --strict
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import time
+from datetime import datetime
+
+# Each branch yields (check, severity, table, record_id, detail)
+AUDIT_QUERY = """
+WITH knight_roles AS (
+    SELECT kr.knight_id,
+           count(*) AS role_count,
+           group_concat(CASE WHEN r.id != 64 THEN r.role END, ', ') AS active_roles
+    FROM knights_roles kr LEFT JOIN roles r ON kr.role_id = r.id
+    GROUP BY kr.knight_id
+),
+knight_checks (test, name, severity) AS (VALUES
+    ('unknown_council', 'knight_unknown_council', 'error'),
+    ('bad_primary_phone', 'knight_bad_phone', 'warning'),
+    ('bad_secondary_phone', 'knight_bad_phone', 'warning'),
+    ('missing_phone', 'officer_missing_phone', 'error'),
+    ('missing_email', 'officer_missing_email', 'warning'),
+    ('missing_address', 'officer_missing_address', 'warning'),
+    ('deceased', 'officer_deceased', 'error')
+)
+
+SELECT 'council_missing_gk', 'error', 'councils', c.id, 'Council ' || c.council_number || ' has no grand knight'
+FROM councils c WHERE c.gk_id IS NULL
+
+UNION ALL
+SELECT 'council_missing_fs', 'error', 'councils', c.id, 'Council ' || c.council_number || ' has no financial secretary'
+FROM councils c WHERE c.fs_id IS NULL
+
+UNION ALL
+SELECT 'council_unknown_gk', 'error', 'councils', c.id, 'Council ' || c.council_number || ' grand knight ' || c.gk_id || ' does not exist'
+FROM councils c LEFT JOIN knights k ON c.gk_id = k.id
+WHERE c.gk_id IS NOT NULL AND k.id IS NULL
+
+UNION ALL
+SELECT 'council_unknown_fs', 'error', 'councils', c.id, 'Council ' || c.council_number || ' financial secretary ' || c.fs_id || ' does not exist'
+FROM councils c LEFT JOIN knights k ON c.fs_id = k.id
+WHERE c.fs_id IS NOT NULL AND k.id IS NULL
+
+UNION ALL
+SELECT 'council_missing_district', 'warning', 'councils', c.id, 'Council ' || c.council_number || ' is not in a known district'
+FROM councils c LEFT JOIN districts d ON c.district_id = d.id
+WHERE d.id IS NULL
+
+UNION ALL
+SELECT 'district_missing_dd', 'error', 'districts', d.id, 'District ' || d.number || ' has no district deputy'
+FROM districts d WHERE d.dd_id IS NULL
+
+UNION ALL
+SELECT 'district_unknown_dd', 'error', 'districts', d.id, 'District ' || d.number || ' district deputy ' || d.dd_id || ' does not exist'
+FROM districts d LEFT JOIN knights k ON d.dd_id = k.id
+WHERE d.dd_id IS NOT NULL AND k.id IS NULL
+
+UNION ALL
+SELECT 'district_no_councils', 'warning', 'districts', d.id, 'District ' || d.number || ' has no councils'
+FROM districts d
+WHERE NOT EXISTS (SELECT 1 FROM councils c WHERE c.district_id = d.id)
+
+-- Every per-knight check in one scan of knights: each knight row is paired
+-- with the check list (CROSS JOIN keeps knights as the outer loop) and the
+-- CASEs pick the condition and message for each check
+UNION ALL
+SELECT ch.name, ch.severity, 'knights', k.id, k.first_name || ' ' || k.last_name || CASE ch.test
+    WHEN 'unknown_council' THEN ' belongs to unknown council ' || k.council
+    WHEN 'bad_primary_phone' THEN ' primary phone cannot be formatted: ' || k.primary_phone
+    WHEN 'bad_secondary_phone' THEN ' secondary phone cannot be formatted: ' || k.secondary_phone
+    WHEN 'missing_phone' THEN ' holds ' || kr.role_count || ' role(s) but has no phone'
+    WHEN 'missing_email' THEN ' holds ' || kr.role_count || ' role(s) but has no email'
+    WHEN 'missing_address' THEN ' holds ' || kr.role_count || ' role(s) but has no address'
+    WHEN 'deceased' THEN ' is deceased but still holds ' || kr.active_roles
+END
+FROM knights k
+LEFT JOIN councils c ON k.council = c.council_number
+LEFT JOIN knight_roles kr ON k.id = kr.knight_id
+CROSS JOIN knight_checks ch
+WHERE CASE ch.test
+    WHEN 'unknown_council' THEN coalesce(k.council, '') != '' AND c.id IS NULL
+    WHEN 'bad_primary_phone' THEN coalesce(k.primary_phone, '') != '' AND NOT phone_ok(k.primary_phone)
+    WHEN 'bad_secondary_phone' THEN coalesce(k.secondary_phone, '') != '' AND NOT phone_ok(k.secondary_phone)
+    WHEN 'missing_phone' THEN kr.role_count > 0 AND coalesce(k.primary_phone, '') = ''
+    WHEN 'missing_email' THEN kr.role_count > 0 AND coalesce(k.email, '') = ''
+    WHEN 'missing_address' THEN kr.role_count > 0 AND (coalesce(k.address, '') = '' OR coalesce(k.city, '') = '')
+    WHEN 'deceased' THEN k.deceased = 1 AND kr.active_roles IS NOT NULL
+END
+
+UNION ALL
+SELECT 'role_unknown_knight', 'error', 'knights_roles', kr.knight_id, 'Role ' || kr.role_id || ' is assigned to unknown knight ' || kr.knight_id
+FROM knights_roles kr LEFT JOIN knights k ON kr.knight_id = k.id
+WHERE k.id IS NULL
+
+UNION ALL
+SELECT 'role_unknown_role', 'error', 'knights_roles', kr.knight_id, 'Knight ' || kr.knight_id || ' holds unknown role ' || kr.role_id
+FROM knights_roles kr LEFT JOIN roles r ON kr.role_id = r.id
+WHERE r.id IS NULL
+
+UNION ALL
+SELECT 'program_role_vacant', 'warning', 'roles', NULL, p.role || ' is vacant'
+FROM ProgramDirectorView p WHERE p.full_name IS NULL
+"""
+
+# AgentsView is not created by the migrations, so this branch is only added
+# when the database has one. The generator reads the view by position (name
+# first, phone fifth), so the column names are looked up the same way.
+AGENT_AUDIT_BRANCH = """
+UNION ALL
+SELECT CASE WHEN coalesce(a."{phone}", '') = '' THEN 'agent_missing_phone' ELSE 'agent_bad_phone' END,
+       CASE WHEN coalesce(a."{phone}", '') = '' THEN 'error' ELSE 'warning' END,
+       'agents', NULL,
+       'Agent ' || coalesce(a."{name}", '[unnamed]') || CASE WHEN coalesce(a."{phone}", '') = ''
+           THEN ' has no phone' ELSE ' phone cannot be formatted: ' || a."{phone}" END
+FROM AgentsView a
+WHERE NOT phone_ok(a."{phone}")
+"""
+
+AUDIT_FIELDS = ['check', 'severity', 'table', 'record_id', 'detail']
+
+
+def _phone_ok(phone):
+    """True if KnightsDirectoryGenerator._format_phone can format the number"""
+    digits = ''.join(filter(str.isdigit, str(phone or '')))
+    return len(digits) == 10 or (len(digits) == 11 and digits[0] == '1')
+
+
+class KnightsAuditor:
+    """Class to run every data-quality check in one pass over the database"""
+
+    def __init__(self, db_path="ok_knights_directory.db"):
+        self.db_path = db_path
+
+    def _agent_branch(self, cursor):
+        """AGENT_AUDIT_BRANCH filled in for this database's AgentsView, or '' without one"""
+        cursor.execute('PRAGMA table_info("AgentsView")')
+        columns = [row[1] for row in cursor.fetchall()]
+        if len(columns) < 5:
+            return ''
+        return AGENT_AUDIT_BRANCH.format(name=columns[0], phone=columns[4])
+
+    def run(self):
+        """Return the audit report as a dict"""
+        start = time.perf_counter()
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.create_function('phone_ok', 1, _phone_ok, deterministic=True)
+            cursor = conn.cursor()
+            cursor.execute(AUDIT_QUERY + self._agent_branch(cursor))
+            issues = [dict(zip(AUDIT_FIELDS, row)) for row in cursor]
+        finally:
+            conn.close()
+
+        summary = {}
+        for issue in issues:
+            summary[issue['check']] = summary.get(issue['check'], 0) + 1
+
+        return {
+            'database': self.db_path,
+            'generated': datetime.now().isoformat(timespec='seconds'),
+            'elapsed_ms': round((time.perf_counter() - start) * 1000, 1),
+            'errors': sum(1 for issue in issues if issue['severity'] == 'error'),
+            'warnings': sum(1 for issue in issues if issue['severity'] == 'warning'),
+            'summary': dict(sorted(summary.items())),
+            'issues': issues
+        }
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Audit the Knights directory database for missing and inconsistent data')
+    parser.add_argument('--database', default='ok_knights_directory.db',
+                        help='Database file path')
+    parser.add_argument('--output',
+                        help='Write the JSON report to this file instead of stdout')
+    parser.add_argument('--strict', action='store_true',
+                        help='Exit with status 1 if any errors are found')
+
+    args = parser.parse_args()
+
+    report = KnightsAuditor(args.database).run()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as report_file:
+            json.dump(report, report_file, indent=2)
+        print(f"Audit report saved as: {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+
+    print(f"{report['errors']} error(s), {report['warnings']} warning(s) in {report['elapsed_ms']} ms",
+          file=sys.stderr)
+
+    if args.strict and report['errors']:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
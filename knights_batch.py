@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# pylint: disable=C0301
+"""
+Knights Directory Batch Builder
+
+Builds the directories for several jurisdictions from one process, using a
+pool of worker processes. Each jurisdiction has its own database, branding
+and section list in a JSON config file:
+
+{
+    "workers": 4,
+    "jurisdictions": [
+        {
+            "name": "oklahoma",
+            "database": "ok_knights_directory.db",
+            "output": "OK_Knights_Directory",
+            "logo": "kofc_logo.png",
+            "branding": {
+                "state": "Oklahoma",
+                "website": "https://www.okkofc.org",
+                "forms_email": "okkofcsubmit@gmail.com"
+            },
+            "sections": ["state_officers", "program_directors", "district_deputies"]
+        }
+    ]
+}
+
+The style sheet, standard fonts and logo images are loaded once before the
+pool starts, and each worker reuses them for every directory it builds. With
+the fork start method (Linux) the workers inherit the parent's copies; with
+spawn (Windows, macOS) each worker loads them once in its initializer.
+
+Usage:
+python knights_batch.py jurisdictions.json
+python knights_batch.py jurisdictions.json --workers 8 --verbose
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from reportlab.pdfbase import pdfmetrics
+
+from knights_database_generator import KnightsDirectoryGenerator, load_logo
+
+FONTS = ['Helvetica', 'Helvetica-Bold']
+
+# Per-process resources shared by every directory built in that process
+_shared = {}
+
+
+def _load_shared_resources(logo_paths):
+    """Load the style sheet, fonts and logos once per process"""
+    if 'styles' not in _shared:
+        # Building one generator gives the fully customised style sheet
+        _shared['styles'] = KnightsDirectoryGenerator(db_path='').pdf_styles
+        for font in FONTS:
+            pdfmetrics.getFont(font)
+
+    for path in logo_paths:
+        if os.path.exists(path):
+            load_logo(path)
+
+
+def _build_directory(job, stream, verbose):
+    """Build one jurisdiction's directory in a worker and time it"""
+    start = time.perf_counter()
+    generator = KnightsDirectoryGenerator(job['database'], job.get('logo', 'kofc_logo.png'),
+                                          branding=job.get('branding'),
+                                          sections=job.get('sections'),
+                                          styles=_shared['styles'])
+
+    log = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    with log:
+        pdf_filename = generator.generate_document(job.get('output', job['name']), stream=stream)
+
+    return {
+        'name': job['name'],
+        'pdf': pdf_filename,
+        'bytes': os.path.getsize(pdf_filename),
+        'seconds': time.perf_counter() - start
+    }
+
+
+def build_all(jobs, workers=None, stream=False, verbose=False):
+    """Build every job concurrently; returns per-job results and batch throughput"""
+    logo_paths = sorted({job.get('logo', 'kofc_logo.png') for job in jobs})
+    _load_shared_resources(logo_paths)
+
+    start = time.perf_counter()
+    results, failures = [], []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_load_shared_resources,
+                             initargs=(logo_paths,)) as pool:
+        futures = {pool.submit(_build_directory, job, stream, verbose): job['name'] for job in jobs}
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+                print(f"Built {result['name']}: {result['pdf']} in {result['seconds']:.2f}s")
+                results.append(result)
+            except Exception as e:  # pylint: disable=broad-except
+                print(f"Failed {futures[future]}: {e}")
+                failures.append({'name': futures[future], 'error': str(e)})
+
+    elapsed = time.perf_counter() - start
+    busy = sum(r['seconds'] for r in results)
+    return {
+        'directories': len(results),
+        'failures': failures,
+        'elapsed_seconds': elapsed,
+        'directories_per_minute': len(results) * 60 / elapsed if elapsed else 0.0,
+        'megabytes_per_second': sum(r['bytes'] for r in results) / 1024 / 1024 / elapsed if elapsed else 0.0,
+        'parallel_speedup': busy / elapsed if elapsed else 0.0,
+        'results': sorted(results, key=lambda r: r['name'])
+    }
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Build Knights of Columbus directories for several jurisdictions')
+    parser.add_argument('config',
+                        help='JSON file listing the jurisdictions to build')
+    parser.add_argument('--workers', type=int,
+                        help='Worker processes (default: config "workers", else one per CPU)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Build each story lazily in bounded chunks')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Show the per-entry progress output of every build')
+
+    args = parser.parse_args()
+
+    with open(args.config, 'r', encoding='utf-8') as config_file:
+        config = json.load(config_file)
+
+    report = build_all(config['jurisdictions'], args.workers or config.get('workers'),
+                       stream=args.stream, verbose=args.verbose)
+
+    print(f"\n{report['directories']} directories in {report['elapsed_seconds']:.2f}s "
+          f"({report['directories_per_minute']:.1f}/min, {report['megabytes_per_second']:.2f} MB/s, "
+          f"{report['parallel_speedup']:.1f}x parallel speedup)")
+    if report['failures']:
+        print(f"{len(report['failures'])} failed: {', '.join(f['name'] for f in report['failures'])}")
+
+if __name__ == "__main__":
+    main()
@@ -12,12 +12,17 @@ pip install reportlab sqlite3 pillow
 Usage:
 python knights_enhanced_generator.py
 python knights_enhanced_generator.py --database /path/to/db.db
+python knights_enhanced_generator.py --stream --trace-memory
 """
 
 import sqlite3
 import os
 import argparse
+import tracemalloc
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from itertools import chain
 
 # PDF imports
 from reportlab.lib.pagesizes import letter
@@ -27,22 +32,121 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 
+from knights_query_cache import QueryCache
+
+# Number of flowables handed to the document builder at a time when streaming
+STORY_CHUNK_SIZE = 200
+
+# Jurisdiction-specific text; override per directory with the branding argument
+DEFAULT_BRANDING = {
+    'state': 'Oklahoma',
+    'website': 'https://www.okkofc.org',
+    'forms_email': 'okkofcsubmit@gmail.com'
+}
+
+# Every section in default order; each has a matching _iter_<name>_section method
+SECTIONS = ['state_officers', 'program_directors', 'district_deputies',
+            'councils', 'agents', 'past_state_deputies']
+
+# Sections listed in the table of contents
+TOC_ENTRIES = {
+    'state_officers': 'State Council Officers',
+    'program_directors': 'Program Directors and Chairmen',
+    'district_deputies': 'District Deputies',
+    'agents': 'Insurance Agents',
+    'past_state_deputies': 'Past State Deputies'
+}
+
+STATE_ABBREVIATIONS = {
+    'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR',
+    'california': 'CA', 'colorado': 'CO', 'connecticut': 'CT', 'delaware': 'DE',
+    'district of columbia': 'DC', 'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI',
+    'idaho': 'ID', 'illinois': 'IL', 'indiana': 'IN', 'iowa': 'IA',
+    'kansas': 'KS', 'kentucky': 'KY', 'louisiana': 'LA', 'maine': 'ME',
+    'maryland': 'MD', 'massachusetts': 'MA', 'michigan': 'MI', 'minnesota': 'MN',
+    'mississippi': 'MS', 'missouri': 'MO', 'montana': 'MT', 'nebraska': 'NE',
+    'nevada': 'NV', 'new hampshire': 'NH', 'new jersey': 'NJ', 'new mexico': 'NM',
+    'new york': 'NY', 'north carolina': 'NC', 'north dakota': 'ND', 'ohio': 'OH',
+    'oklahoma': 'OK', 'oregon': 'OR', 'pennsylvania': 'PA', 'rhode island': 'RI',
+    'south carolina': 'SC', 'south dakota': 'SD', 'tennessee': 'TN', 'texas': 'TX',
+    'utah': 'UT', 'vermont': 'VT', 'virginia': 'VA', 'washington': 'WA',
+    'west virginia': 'WV', 'wisconsin': 'WI', 'wyoming': 'WY',
+    '': ''
+}
+
+@lru_cache(maxsize=None)
+def load_logo(image_path):
+    """Read a logo file once per process; every later directory reuses the bytes"""
+    with open(image_path, 'rb') as image_file:
+        return image_file.read()
+
+class FlowableStream(list):
+    """Story list that is topped up from a generator as reportlab consumes it
+
+    doc.build() only ever looks at the front of the story and deletes
+    flowables once they are drawn, so keeping at most chunk_size of them
+    alive bounds memory no matter how long the document is.
+    """
+
+    def __init__(self, source, chunk_size=STORY_CHUNK_SIZE):
+        super().__init__()
+        self._source = iter(source)
+        self.chunk_size = chunk_size
+        self._refill()
+
+    def _refill(self):
+        """Pull the next chunk once the buffer has drained to half"""
+        if self._source is None or list.__len__(self) > self.chunk_size // 2:
+            return
+        while list.__len__(self) < self.chunk_size:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                self._source = None
+                break
+
+    def __len__(self):
+        self._refill()
+        return list.__len__(self)
+
+class DirectoryDocTemplate(SimpleDocTemplate):
+    """Document template that notes the page each section header lands on"""
+
+    def afterFlowable(self, flowable):
+        """Record the current page on the first drawn header of each section"""
+        section = getattr(flowable, 'directory_section', None)
+        if section is not None and section['page'] is None:
+            section['page'] = self.page
+
 class KnightsDirectoryGenerator:
     """Class to represent all functions and data for generating the KofC database"""
 
-    def __init__(self, db_path="ok_knights_directory.db", image_path="knights_logo.jpg"):
+    def __init__(self, db_path="ok_knights_directory.db", image_path="knights_logo.jpg", cache=None,
+                 branding=None, sections=None, styles=None, year=None):
         self.db_path = db_path
         self.image_path = image_path
+        self.cache = cache
+        self.branding = {**DEFAULT_BRANDING, **(branding or {})}
+        self.sections = sections or SECTIONS
+        unknown = [section for section in self.sections if section not in SECTIONS]
+        if unknown:
+            raise ValueError(f"Unknown section(s): {', '.join(unknown)}")
         self.pdf_story = []
-        self.pdf_styles = getSampleStyleSheet()
-        self.setup_pdf_styles()
-
-        self.state_abbv = {
-            'oklahoma': 'OK',
-            'texas': 'TX',
-            'colorado': 'CO',
-            '': ''
-        }
+        self.directory_model = {'pages': 0, 'sections': []}
+
+        # Directory year: the title page and which past state deputy terms
+        # have ended. Pinned by knights_verify.py so builds do not drift with
+        # the calendar; must not be later than the current year.
+        self.year = year or datetime.now().year
+
+        # A style sheet can be shared between generators (see knights_batch.py)
+        if styles is None:
+            self.pdf_styles = getSampleStyleSheet()
+            self.setup_pdf_styles()
+        else:
+            self.pdf_styles = styles
+
+        self.state_abbv = STATE_ABBREVIATIONS
 
     def setup_pdf_styles(self):
         """Setup custom PDF styles"""
@@ -130,14 +234,14 @@ class KnightsDirectoryGenerator:
         title_elements = []
 
         # Add main title
-        title_elements.append(Paragraph("Oklahoma Knights of Columbus", self.pdf_styles['CustomTitle']))
+        title_elements.append(Paragraph(f"{self.branding['state']} Knights of Columbus", self.pdf_styles['CustomTitle']))
         title_elements.append(Paragraph("State Directory", self.pdf_styles['CustomTitle']))
 
         # Add image if it exists
         if os.path.exists(self.image_path):
             try:
                 # Create image - adjust size as needed
-                img = Image(self.image_path)
+                img = Image(BytesIO(load_logo(self.image_path)))
                 
                 # Scale image to fit nicely on page (max 4 inches wide or high)
                 img_width, img_height = img.drawWidth, img.drawHeight
@@ -167,7 +271,7 @@ class KnightsDirectoryGenerator:
             title_elements.append(Spacer(1, 60))
         
         # Add current year
-        current_year = datetime.now().year
+        current_year = self.year
         next_year = current_year + 1
         title_elements.append(Paragraph(f"{current_year}-{next_year}", self.pdf_styles['SubTitle']))
         
@@ -410,190 +514,237 @@ class KnightsDirectoryGenerator:
         
         return KeepTogether(table)
 
-    def _get_state_officers_data(self):
-        """Query database for state officers"""
+    def create_pdf_psd_table(self, psd):
+        """Create a PDF table for past state deputies and their widows"""
+        data = [
+            # Row 1: Term, Name, Council, Phone
+            [
+                Paragraph(f"<b>{psd['term']}</b>", self.pdf_styles['Normal']),
+                Paragraph(psd['name'], self.pdf_styles['Normal']),
+                '',
+                Paragraph(psd['council'], self.pdf_styles['CenterNormal']),
+                Paragraph(psd['phone'], self.pdf_styles['RightNormal'])
+            ],
+            # Row 2: Address
+            [
+                '',
+                Paragraph(psd['address'], self.pdf_styles['Normal']),
+                '', '', ''
+            ],
+            # Row 3: City/State/Zip and Email
+            [
+                '',
+                Paragraph(psd['city_state_zip'], self.pdf_styles['Normal']),
+                Paragraph(psd['email'], self.pdf_styles['RightNormal']),
+                '', ''
+            ]
+        ]
+
+        # SUM MUST REMAIN <= 6.5
+        table = Table(data,
+                      colWidths=[0.9*inch, 1.9*inch, 1.7*inch, 0.7*inch, 1.3*inch],
+                      rowHeights=[0.175*inch, 0.175*inch, 0.175*inch])
+
+        # Table styling (no borders)
+        table.setStyle(TableStyle([
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('BACKGROUND', (0, 0), (-1, -1), colors.white),
+            ('SPAN', (0, 0), (0, 2)),   # Span term down all rows
+            ('SPAN', (1, 0), (2, 0)),   # Span name across 2 columns
+            ('SPAN', (1, 1), (2, 1)),   # Span address across 2 columns
+            ('SPAN', (3, 0), (3, 2)),   # Span council down all rows
+            ('SPAN', (4, 0), (4, 2)),   # Span phone down all rows
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]))
+
+        return KeepTogether(table)
+
+    def _iter_view(self, query, from_row, fallback=None, params=()):
+        """Stream rows for a query straight from the cursor (or the query cache), converting each with from_row"""
         if not os.path.exists(self.db_path):
             print(f"Database file not found: {self.db_path}")
-            return self.get_sample_data()
-        
+            yield from fallback or []
+            return
+
+        if self.cache is not None:
+            try:
+                rows = self.cache.fetch(query, params)
+            except sqlite3.Error as e:
+                print(f"Database error: {e}")
+                rows = None
+            if rows is None:
+                yield from fallback or []
+            else:
+                yield from map(from_row, rows)
+            return
+
+        conn = sqlite3.connect(self.db_path)
+        yielded = False
         try:
-            conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
-            
-            query = "SELECT * FROM StateOfficerView"
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            
-            officers = []
-            for row in rows:
-                officer = {
-                    'full_name': row[0] or '[ERROR]',
-                    'wife': row[1] or '',
-                    'address': row[2] or '[NO DATA]',
-                    'city_state_zip': row[3] or '[NO DATA]',
-                    'phone': self._format_phone(row[4]),
-                    'email': row[5] or '[NO DATA]',
-                    'council': f"{row[6]}" if row[6] else '',
-                    'role': row[8] or '[ERROR]'
-                }
-                officers.append(officer)
-            
-            conn.close()
-            return officers
-            
+            cursor.execute(query, params)
+            for row in cursor:
+                yielded = True
+                yield from_row(row)
+
         except sqlite3.Error as e:
             print(f"Database error: {e}")
-            return self.get_sample_data()
+            # Rows already in the story would leave a section cut short, so
+            # only fall back before the first row; after that, fail the build
+            if yielded:
+                raise
+            yield from fallback or []
+
+        finally:
+            conn.close()
+
+    def _officer_from_row(self, row):
+        """Convert a StateOfficerView row"""
+        return {
+            'full_name': row[0] or '[ERROR]',
+            'wife': row[1] or '',
+            'address': row[2] or '[NO DATA]',
+            'city_state_zip': row[3] or '[NO DATA]',
+            'phone': self._format_phone(row[4]),
+            'email': row[5] or '[NO DATA]',
+            'council': f"{row[6]}" if row[6] else '',
+            'role': row[8] or '[ERROR]'
+        }
+
+    def _dd_from_row(self, row):
+        """Convert a DistrictsView row"""
+        address = row[2].split('|') if row[2] else ['', '', '', '']
+        # Ensure we have at least 4 elements for address
+        while len(address) < 4:
+            address.append('')
+
+        councils = row[6].split('|') if row[6] else []
+
+        return {
+            'number': str(row[0]) or '[ERROR]',
+            'district_deputy': row[1] or '[VACANT]',
+            'address': address[0] or '',
+            'city_state_zip': f"{address[1]}, {self.state_abbv[str.lower(address[2])]} {address[3]}".strip(' ,'),
+            'phone': self._format_phone(row[3]) or '',
+            'email': row[4] or '',
+            'home_council': str(row[5]) or '',
+            'councils': councils
+        }
+
+    def _council_from_row(self, row):
+        """Convert a CouncilsView row"""
+        address = row[1].split('\n') if row[1] is not None else ['', '', '', '']
+        gk = (row[3].split('\n') if row[3] is not None else ['', '', '']) + [self._format_phone(row[4]), row[5] if row[5] is not None else '']
+        fs = (row[6].split('\n') if row[6] is not None else ['', '', '']) + [self._format_phone(row[7]), row[8] if row[8] is not None else '']
+        return {
+            'number': str(row[0] or '[ERROR]'),
+            'address': address,
+            'district': str(row[2]) or 'UNASSIGNED',
+            'gk': gk,
+            'fs': fs
+        }
+
+    def _program_director_from_row(self, row):
+        """Convert a ProgramDirectorView row"""
+        return {
+            'full_name': row[1] or '[VACANT]',
+            'wife': row[2] or '',
+            'address': row[3] or '[NO DATA]',
+            'city_state_zip': row[4] or '[NO DATA]',
+            'phone': self._format_phone(row[5]),
+            'email': row[6] or '[NO DATA]',
+            'council': f"{row[7]}" if row[7] else '[NO DATA]',
+            'role': row[0] or '[ERROR]'
+        }
+
+    def _agent_from_row(self, row):
+        """Convert an AgentsView row"""
+        return {
+            'name': row[0] or '[ERROR]',
+            'wife': row[1] or '',
+            'email': row[2] or '[ERROR]',
+            'council': str(row[3]) or '[ERROR]',
+            'phone': self._format_phone(row[4]) or '[ERROR]',
+            'councils_represented': row[5] or '',
+            'role': row[6] or '[ERROR]',
+            'address': row[7] or '',
+            'city': row[8] or '',
+            'state': self.state_abbv[str.lower(row[9])] or '',
+            'zip': row[10] or ''
+        }
+
+    def _psd_from_row(self, row):
+        """Convert a PastStateDeputyView row"""
+        return {
+            'term': f"{row[0]}-{row[1]}",
+            'name': row[2] or '[ERROR]',
+            'wife': row[3] or '',
+            'address': row[4] or '[NO DATA]',
+            'city_state_zip': row[5] or '[NO DATA]',
+            'phone': self._format_phone(row[6]),
+            'email': row[7] or '',
+            'council': f"{row[8]}" if row[8] else '',
+            'deceased': row[9] == 1
+        }
+
+    def _iter_state_officers(self):
+        """Stream state officers from the database"""
+        return self._iter_view("SELECT * FROM StateOfficerView",
+                               self._officer_from_row, self.get_sample_data())
+
+    def _iter_dds(self):
+        """Stream district deputies from the database"""
+        return self._iter_view("SELECT * FROM DistrictsView ORDER BY CAST(number AS INTEGER)",
+                               self._dd_from_row)
+
+    def _iter_councils(self):
+        """Stream councils from the database"""
+        return self._iter_view("SELECT * FROM CouncilsView ORDER BY CAST(number AS INTEGER)",
+                               self._council_from_row)
+
+    def _iter_program_directors(self):
+        """Stream program directors from the database"""
+        return self._iter_view("SELECT * FROM ProgramDirectorView",
+                               self._program_director_from_row, self.get_sample_data())
+
+    def _iter_agents(self):
+        """Stream insurance agents from the database (none if AgentsView is missing)"""
+        return self._iter_view("SELECT * FROM AgentsView", self._agent_from_row)
+
+    def _get_past_state_deputies(self):
+        """Split past state deputies into living PSDs and widows in one pass over the term-ordered view"""
+        living, widows = [], []
+        # The view only goes up to the current year; the directory's own year
+        # can be earlier when it is pinned
+        for psd in self._iter_view("SELECT * FROM PastStateDeputyView WHERE term_end <= ? ORDER BY term_start", self._psd_from_row,
+                                   params=(self.year,)):
+            if not psd['deceased']:
+                living.append(psd)
+            elif psd['wife']:
+                widows.append({**psd, 'name': f"{psd['wife']} ({psd['name']})"})
+        return living, widows
+
+    def _get_state_officers_data(self):
+        """Query database for state officers"""
+        return list(self._iter_state_officers())
 
     def _get_dd_data(self):
         """Query database for district deputies"""
-        if not os.path.exists(self.db_path):
-            print(f"Database file not found: {self.db_path}")
-            return []
-        
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            query = "SELECT * FROM DistrictsView ORDER BY CAST(number AS INTEGER)"
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            
-            dds = []
-            for row in rows:
-                address = row[2].split('|') if row[2] else ['', '', '', '']
-                # Ensure we have at least 4 elements for address
-                while len(address) < 4:
-                    address.append('')
-                
-                councils = row[6].split('|') if row[6] else []
-                
-                dd = {
-                    'number': str(row[0]) or '[ERROR]',
-                    'district_deputy': row[1] or '[VACANT]',
-                    'address': address[0] or '',
-                    'city_state_zip': f"{address[1]}, {self.state_abbv[str.lower(address[2])]} {address[3]}".strip(' ,'),
-                    'phone': self._format_phone(row[3]) or '',
-                    'email': row[4] or '',
-                    'home_council': str(row[5]) or '',
-                    'councils': councils
-                }
-                dds.append(dd)
-            
-            conn.close()
-            return dds
-            
-        except sqlite3.Error as e:
-            print(f"Database error: {e}")
-            return []
-        
+        return list(self._iter_dds())
+
     def _get_council_data(self):
         """query database for councils"""
-        if not os.path.exists(self.db_path):
-            print(f'Database file not found: {self.db_path}')
-            return []
-        
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            query = "SELECT * FROM CouncilsView ORDER BY CAST(number AS INTEGER)"
-            cursor.execute(query)
-            rows = cursor.fetchall()
-
-            councils = []
-            for row in rows:
-                address = row[1].split('\n') if row[1] is not None else ['', '', '', '']
-                gk = (row[3].split('\n') if row[3] is not None else ['', '', '']) + [self._format_phone(row[4]), row[5] if row[5] is not None else '']
-                fs = (row[6].split('\n') if row[6] is not None else ['', '', '']) + [self._format_phone(row[7]), row[8] if row[8] is not None else '']
-                council = {
-                    'number': str(row[0] or '[ERROR]'),
-                    'address': address,
-                    'district': str(row[2]) or 'UNASSIGNED',
-                    'gk': gk,
-                    'fs': fs
-                }
-                councils.append(council)
-
-            conn.close()
-            return councils
-
-        except sqlite3.Error as e:
-            print(f'Database error: {e}')
-            return []
+        return list(self._iter_councils())
 
     def _get_program_director_data(self):
-        """Query database for state officers"""
-        if not os.path.exists(self.db_path):
-            print(f"Database file not found: {self.db_path}")
-            return self.get_sample_data()
-        
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            query = "SELECT * FROM ProgramDirectorView"
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            
-            officers = []
-            for row in rows:
-                officer = {
-                    'full_name': row[1] or '[VACANT]',
-                    'wife': row[2] or '',
-                    'address': row[3] or '[NO DATA]',
-                    'city_state_zip': row[4] or '[NO DATA]',
-                    'phone': self._format_phone(row[5]),
-                    'email': row[6] or '[NO DATA]',
-                    'council': f"{row[7]}" if row[7] else '[NO DATA]',
-                    'role': row[0] or '[ERROR]'
-                }
-                officers.append(officer)
-            
-            conn.close()
-            return officers
-            
-        except sqlite3.Error as e:
-            print(f"Database error: {e}")
-            return self.get_sample_data()
-        
+        """Query database for program directors"""
+        return list(self._iter_program_directors())
+
     def _get_agent_data(self):
-        """Query database for state officers"""
-        if not os.path.exists(self.db_path):
-            print(f"Database file not found: {self.db_path}")
-            return self.get_sample_data()
-        
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            query = "SELECT * FROM AgentsView"
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            
-            agents = []
-            for row in rows:
-                agent = {
-                    'name': row[0] or '[ERROR]',
-                    'wife': row[1] or '',
-                    'email': row[2] or '[ERROR]',
-                    'council': str(row[3]) or '[ERROR]',
-                    'phone': self._format_phone(row[4]) or '[ERROR]',
-                    'councils_represented': row[5] or '',
-                    'role': row[6] or '[ERROR]',
-                    'address': row[7] or '',
-                    'city': row[8] or '',
-                    'state': self.state_abbv[str.lower(row[9])] or '',
-                    'zip': row[10] or ''
-                }
-                agents.append(agent)
-            
-            conn.close()
-            return agents
-            
-        except sqlite3.Error as e:
-            print(f"Database error: {e}")
-            return self.get_sample_data()
+        """Query database for insurance agents"""
+        return list(self._iter_agents())
 
     def _format_phone(self, phone):
         """Format phone number"""
@@ -624,8 +775,150 @@ class KnightsDirectoryGenerator:
             }
         ]
 
-    def generate_document(self, output_base):
-        """Generate PDF document with simple linked TOC"""
+    def _iter_section(self, records, anchor, title, make_table, describe, label, intro=(), spacing=12, page_break=True):
+        """Lazily yield one section's flowables; only a bare anchor if there are no records
+
+        describe gives the progress message for a record and label its key in
+        the structural model, which knights_verify.py diffs against a baseline.
+        """
+        records = iter(records)
+        first = next(records, None)
+        if first is None:
+            # The table of contents links every section, so keep the target
+            if anchor in TOC_ENTRIES:
+                yield Paragraph(f'<a name="{anchor}"/>', self.pdf_styles['Normal'])
+            return
+
+        # Record the section in the structural model used by knights_verify.py
+        section = {'anchor': anchor, 'title': title, 'page': None, 'entries': 0, 'labels': []}
+        self.directory_model['sections'].append(section)
+
+        header = Paragraph(f'<a name="{anchor}"/>{title}', self.pdf_styles['SectionHeader'])
+        header.directory_section = section
+        yield header
+        yield from intro
+
+        for record in chain([first], records):
+            print(f"Adding {describe(record)}")
+            section['entries'] += 1
+            section['labels'].append(label(record))
+            yield make_table(record)
+            yield Spacer(1, spacing)
+
+        if page_break:
+            yield PageBreak()
+
+    def _iter_state_officers_section(self):
+        """State council officers, with the state website and forms email"""
+        website = self.branding['website']
+        forms_email = self.branding['forms_email']
+        return self._iter_section(
+            self._iter_state_officers(),
+            'state_officers', 'State Council Officers',
+            self.create_pdf_officer_table,
+            lambda officer: f"{officer['role']}: {officer['full_name']}",
+            lambda officer: f"{officer['role']}|{officer['full_name']}",
+            intro=[
+                Paragraph(f'Official State Council Website: <link href="{website}">{website.split("://")[-1]}</link>',
+                          self.pdf_styles['CenterNormal']),
+                Paragraph(f'State forms submittal email: <link href="mailto:{forms_email}">{forms_email}</link>',
+                          self.pdf_styles['CenterNormal']),
+                Spacer(1, 5)
+            ])
+
+    def _iter_program_directors_section(self):
+        """Program directors and chairmen"""
+        return self._iter_section(
+            self._iter_program_directors(),
+            'program_directors', 'Program Directors and Chairmen',
+            self.create_pdf_programdirector_table,
+            lambda director: f"{director['role']}: {director['full_name']}",
+            lambda director: f"{director['role']}|{director['full_name']}",
+            intro=[Spacer(1, 5)])
+
+    def _iter_district_deputies_section(self):
+        """District deputies"""
+        return self._iter_section(
+            self._iter_dds(),
+            'district_deputies', 'District Deputies',
+            self.create_pdf_dd_table,
+            lambda dd: f"District {dd['number']}: {dd['district_deputy']}",
+            lambda dd: f"{dd['number']}|{dd['district_deputy']}",
+            intro=[Spacer(1, 12)],
+            spacing=8)
+
+    def _iter_councils_section(self):
+        """Councils"""
+        return self._iter_section(
+            self._iter_councils(),
+            'councils', 'Councils',
+            self.create_pdf_council_table,
+            lambda council: f"Council {council['number']}",
+            lambda council: str(council['number']),
+            intro=[Spacer(1, 12)],
+            spacing=8)
+
+    def _iter_agents_section(self):
+        """Insurance agents"""
+        return self._iter_section(
+            self._iter_agents(),
+            'agents', 'Insurance Agents',
+            self.create_pdf_agents_table,
+            lambda agent: f"agent {agent['name']}",
+            lambda agent: f"{agent['name']}|{agent['council']}",
+            intro=[Spacer(1, 5)])
+
+    def _iter_past_state_deputies_section(self):
+        """Past state deputies followed by their widows (no page break between)"""
+        # Past State Deputies and their widows share one term-ordered query
+        past_state_deputies, widows = self._get_past_state_deputies()
+
+        yield from self._iter_section(
+            past_state_deputies,
+            'past_state_deputies', 'Past State Deputies',
+            self.create_pdf_psd_table,
+            lambda psd: f"Past State Deputy {psd['term']}: {psd['name']}",
+            lambda psd: f"{psd['term']}|{psd['name']}",
+            intro=[Spacer(1, 5)],
+            page_break=False)
+
+        yield from self._iter_section(
+            widows,
+            'psd_widows', 'Widows of Past State Deputies',
+            self.create_pdf_psd_table,
+            lambda widow: f"widow {widow['term']}: {widow['name']}",
+            lambda widow: f"{widow['term']}|{widow['name']}",
+            intro=[Spacer(1, 5)],
+            page_break=False)
+
+    def _iter_story(self):
+        """Lazily yield every flowable of the directory in order"""
+        # Add title page
+        yield from self.create_title_page()
+
+        # Add simple TOC
+        yield Paragraph("Table of Contents", self.pdf_styles['TOCHeading'])
+        yield Spacer(1, 30)
+
+        # Manual TOC entries with links
+        toc = [section for section in self.sections if section in TOC_ENTRIES]
+        for i, section in enumerate(toc):
+            if i:
+                yield Spacer(1, 8)
+            yield Paragraph(f'<link href="#{section}" color="blue">{TOC_ENTRIES[section]}</link>', self.pdf_styles['Normal'])
+        yield PageBreak()
+
+        # Each section carries its own anchor
+        for section in self.sections:
+            yield from getattr(self, f"_iter_{section}_section")()
+
+    def generate_document(self, output_base, stream=False, chunk_size=STORY_CHUNK_SIZE):
+        """Generate PDF document with simple linked TOC
+
+        With stream=True the story is never held in memory as a whole: rows are
+        read from the cursor and turned into flowables as the document builder
+        consumes them, at most chunk_size at a time.
+        """
         print("Generating PDF document with simple TOC...")
         
         margin_factor = 1.0
@@ -634,112 +927,21 @@ class KnightsDirectoryGenerator:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         pdf_filename = f"{output_base}_{timestamp}.pdf"
 
-        doc = SimpleDocTemplate(pdf_filename, pagesize=letter,
+        doc = DirectoryDocTemplate(pdf_filename, pagesize=letter,
                             rightMargin=margin_factor*inch, leftMargin=margin_factor*inch,
                             topMargin=margin_factor*inch, bottomMargin=margin_factor*inch)
         
-        story = []
-        
-        # Add title page
-        story.extend(self.create_title_page())
-        
-        # Add simple TOC
-        story.append(Paragraph("Table of Contents", self.pdf_styles['TOCHeading']))
-        story.append(Spacer(1, 30))
-        
-        # Manual TOC entries with links
-        story.append(Paragraph('<link href="#state_officers" color="blue">State Council Officers</link>', self.pdf_styles['Normal']))
-        story.append(Spacer(1, 8))
-        story.append(Paragraph('<link href="#program_directors" color="blue">Program Directors and Chairmen</link>', self.pdf_styles['Normal']))
-        story.append(Spacer(1, 8))
-        story.append(Paragraph('<link href="#district_deputies" color="blue">District Deputies</link>', self.pdf_styles['Normal']))
-        story.append(Spacer(1, 8))
-        story.append(Paragraph('<link href="#agents" color="blue">Insurance Agents</link>', self.pdf_styles['Normal']))
-        story.append(PageBreak())
-        
-        # Officers section with anchor
-        officers = self._get_state_officers_data()
-        if officers:
-            story.append(Paragraph('<a name="state_officers"/>State Council Officers', self.pdf_styles['SectionHeader']))
-            story.append(Paragraph('Official State Council Website: <link href="https://www.okkofc.org">www.okkofc.org</link>',
-                                   self.pdf_styles['CenterNormal']))
-            story.append(Paragraph('State forms submittal email: <link href=mailto:okkofcsubmit@gmail.com">okkofcsubmit@gmail.com</link>',
-                                   self.pdf_styles['CenterNormal']))
-            story.append(Spacer(1, 5))
-            
-            for officer in officers:
-                print(f"Adding {officer['role']}: {officer['full_name']}")
-                story.append(self.create_pdf_officer_table(officer))
-                story.append(Spacer(1, 12))
-            
-            story.append(PageBreak())
-        
-        # Program Directors Section with anchor
-        p_directors = self._get_program_director_data()
-        if p_directors:
-            story.append(Paragraph('<a name="program_directors"/>Program Directors and Chairmen', self.pdf_styles['SectionHeader']))
-            story.append(Spacer(1, 5))
-
-            for director in p_directors:
-                print(f"Adding {director['role']}: {director['full_name']}")
-                story.append(self.create_pdf_programdirector_table(director))
-                story.append(Spacer(1, 12))
-
-        story.append(PageBreak())
-        
-        # District Deputies section with anchor
-        dds = self._get_dd_data()
-        if dds:
-            story.append(Paragraph('<a name="district_deputies"/>District Deputies', self.pdf_styles['SectionHeader']))
-            story.append(Spacer(1, 12))
-            
-            for dd in dds:
-                print(f"Adding District {dd['number']}: {dd['district_deputy']}")
-                story.append(self.create_pdf_dd_table(dd))
-                story.append(Spacer(1, 8))
-            
-            story.append(PageBreak())
-
-        councils = self._get_council_data()
-        if councils:
-            story.append(Paragraph('<a name="councils"/>Councils', self.pdf_styles['SectionHeader']))
-            story.append(Spacer(1, 12))
-            
-            for council in councils:
-                print(f"Adding Council {council['number']}")
-                story.append(self.create_pdf_council_table(council))
-                story.append(Spacer(1, 8))
-            
-            story.append(PageBreak())
-
-        # Insurance Agents Section with anchor
-        agents =self._get_agent_data()
-        if agents:
-            story.append(Paragraph('<a name="agents"/>Insurance Agents',
-                                   self.pdf_styles['SectionHeader']))
-            story.append(Spacer(1,5))
-
-            for agent in agents:
-                print(f"Adding agent {agent['name']}")
-                story.append(self.create_pdf_agents_table(agent))
-                story.append(Spacer(1, 12))
-
-            story.append(PageBreak())
-
-        # TODO Past State Deputies Section with Anchor
-        # | TERM | NAME    | ----- | COUNCIL | PHONE |
-        # | ---- | ADDRESS | ----- | ------- | ----- |
-        # | ---- | C/S/Z   | EMAIL | ------- | ----- |
-
-        # NO BREAK
-
-        # TODO Widows of Past State Deputies with Anchor
-        # | TERM | NAME    | ----- | COUNCIL | PHONE |
-        # | ---- | ADDRESS | ----- | ------- | ----- |
-        # | ---- | C/S/Z   | EMAIL | ------- | ----- |
+        self.directory_model = {'pages': 0, 'sections': []}
+        if stream:
+            story = FlowableStream(self._iter_story(), chunk_size)
+        else:
+            story = list(self._iter_story())
 
         doc.build(story)
+        self.directory_model['pages'] = doc.page
         print(f"PDF document saved as: {pdf_filename}")
+        return pdf_filename
+
 
 def main():
     """Main function"""
@@ -750,11 +952,35 @@ def main():
                        help='Output filename base')
     parser.add_argument('--image', default='kofc_logo.png',
                        help='Logo image file path')
+    parser.add_argument('--stream', action='store_true',
+                       help='Build the story lazily in bounded chunks (for very large sections)')
+    parser.add_argument('--chunk-size', type=int, default=STORY_CHUNK_SIZE,
+                       help='Flowables held in memory at a time with --stream')
+    parser.add_argument('--trace-memory', action='store_true',
+                       help='Report peak Python memory used by the build')
+    parser.add_argument('--cache', action='store_true',
+                       help='Reuse view results from <database>.cache while the database is unchanged')
+    parser.add_argument('--year', type=int,
+                       help='Directory year (default: the current year)')
     
     args = parser.parse_args()
     
-    generator = KnightsDirectoryGenerator(args.database, args.image)
-    generator.generate_document(args.output)
+    if args.trace_memory:
+        tracemalloc.start()
+
+    cache = QueryCache(args.database, persist_path=f"{args.database}.cache") if args.cache else None
+
+    generator = KnightsDirectoryGenerator(args.database, args.image, cache, year=args.year)
+    generator.generate_document(args.output, stream=args.stream, chunk_size=args.chunk_size)
+
+    if cache is not None:
+        cache.save()
+        print(f"Query cache: {cache.hits} hit(s), {cache.misses} miss(es)")
+
+    if args.trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"Peak memory: {peak / 1024 / 1024:.1f} MiB")
     
     print("\nSuccess! Directory generated as PDF")
 
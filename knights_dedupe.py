@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+# pylint: disable=C0301
+"""
+Knights Duplicate Detection
+
+Finds knights that were entered more than once (usually by repeated CSV
+imports) and proposes or applies merges.
+
+Candidates are only compared when they share a blocking key (normalized
+phone, normalized email or a name key), so the work grows with the size of
+the roster rather than with the number of possible pairs. Large blocks are
+compared with a sliding window over a sorted order instead of all pairs.
+
+A pair is scored only when the names agree; different middle names or Jr./Sr.
+suffixes rule it out, and at the default threshold so does a different email
+(a father and son can share a name, address and phone). Matching pairs are
+grouped, but two groups are never joined if any knight in one conflicts with
+any knight in the other, so a record without a middle name cannot link two
+different people.
+
+Merging keeps the lowest knight id, fills in any of its empty fields from the
+duplicates, and repoints knights_roles, role_terms, districts.dd_id and
+councils.gk_id / fs_id before deleting the duplicate rows.
+
+Usage:
+python knights_dedupe.py
+python knights_dedupe.py --database /path/to/db.db --threshold 0.9
+python knights_dedupe.py --apply
+"""
+
+import argparse
+import re
+import sqlite3
+from collections import defaultdict
+from difflib import SequenceMatcher
+
+KNIGHT_FIELDS = ['id', 'first_name', 'middle_name', 'last_name', 'wife',
+                 'address', 'city', 'zipcode', 'primary_phone',
+                 'secondary_phone', 'email', 'deceased', 'state', 'council']
+
+# field name -> weight in the similarity score; a field missing from either
+# knight is left out and the score is taken over the fields both have
+SCORE_WEIGHTS = {
+    'name': 0.4,
+    'middle_name': 0.1,
+    'address': 0.15,
+    'phone': 0.15,
+    'email': 0.15,
+    'council': 0.05
+}
+
+# The best score two knights can reach when both have an email and the emails
+# differ (a father and son sharing a name, address and phone). The default
+# threshold sits above it; different middle names or Jr./Sr. suffixes are
+# vetoed outright.
+EMAIL_MISMATCH_SCORE = 1 - SCORE_WEIGHTS['email'] / sum(SCORE_WEIGHTS.values())
+DEFAULT_THRESHOLD = 0.9
+
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+
+# Tables/columns that point at knights.id and must follow a merge
+KNIGHT_REFERENCES = [
+    ('districts', 'dd_id'),
+    ('councils', 'gk_id'),
+    ('councils', 'fs_id')
+]
+
+
+class KnightsDeduplicator:
+    """Class to detect and merge duplicate knights in the directory database"""
+
+    def __init__(self, db_path="ok_knights_directory.db", threshold=DEFAULT_THRESHOLD, window=10):
+        self.db_path = db_path
+        self.threshold = threshold
+        self.window = window
+
+    @staticmethod
+    def _normalize_phone(phone):
+        """Reduce a phone number to its last 10 digits"""
+        digits = ''.join(filter(str.isdigit, str(phone or '')))
+        return digits[-10:] if len(digits) >= 10 else ''
+
+    @staticmethod
+    def _normalize_email(email):
+        """Lowercase and trim an email address"""
+        email = (email or '').strip().lower()
+        return email if '@' in email else ''
+
+    @staticmethod
+    def _normalize_text(text):
+        """Lowercase text and strip punctuation and extra whitespace"""
+        return ' '.join(re.sub(r'[^a-z0-9 ]', ' ', str(text or '').lower()).split())
+
+    def _name_key(self, knight):
+        """Blocking key built from last name and first initial"""
+        last = self._split_suffix(knight['last_name'])[0].replace(' ', '')
+        first = self._normalize_text(knight['first_name'])
+        if not last or not first:
+            return ''
+        return f"{last}:{first[0]}"
+
+    def _blocking_keys(self, knight):
+        """All blocking keys for one knight"""
+        keys = []
+        for phone in (knight['primary_phone'], knight['secondary_phone']):
+            phone = self._normalize_phone(phone)
+            if phone:
+                keys.append(f"phone:{phone}")
+        email = self._normalize_email(knight['email'])
+        if email:
+            keys.append(f"email:{email}")
+        name = self._name_key(knight)
+        if name:
+            keys.append(f"name:{name}")
+        return keys
+
+    def _split_suffix(self, last_name):
+        """Split 'Smith Jr.' into ('smith', 'jr')"""
+        words = self._normalize_text(last_name).split()
+        if len(words) > 1 and words[-1] in NAME_SUFFIXES:
+            return ' '.join(words[:-1]), words[-1]
+        return ' '.join(words), ''
+
+    def _middle_names_agree(self, a, b):
+        """True/False if both knights have a middle name, else None; an initial agrees with a full name"""
+        a = self._normalize_text(a).replace(' ', '')
+        b = self._normalize_text(b).replace(' ', '')
+        if not a or not b:
+            return None
+        if len(a) == 1 or len(b) == 1:
+            return a[0] == b[0]
+        return a == b
+
+    def _conflict(self, a, b):
+        """True if middle names or name suffixes show two knights are different people"""
+        suffix_a = self._split_suffix(a['last_name'])[1]
+        suffix_b = self._split_suffix(b['last_name'])[1]
+        return (self._middle_names_agree(a['middle_name'], b['middle_name']) is False
+                or bool(suffix_a and suffix_b and suffix_a != suffix_b))
+
+    def _similarity(self, a, b):
+        """String similarity in [0, 1], or None if either side is empty"""
+        a = self._normalize_text(a)
+        b = self._normalize_text(b)
+        if not a or not b:
+            return None
+        if a == b:
+            return 1.0
+        return SequenceMatcher(None, a, b).ratio()
+
+    def score(self, a, b):
+        """Weighted similarity of two knights over the fields both have"""
+        phones_a = {self._normalize_phone(a['primary_phone']), self._normalize_phone(a['secondary_phone'])} - {''}
+        phones_b = {self._normalize_phone(b['primary_phone']), self._normalize_phone(b['secondary_phone'])} - {''}
+        email_a = self._normalize_email(a['email'])
+        email_b = self._normalize_email(b['email'])
+
+        last_a = self._split_suffix(a['last_name'])[0]
+        last_b = self._split_suffix(b['last_name'])[0]
+        middle = self._middle_names_agree(a['middle_name'], b['middle_name'])
+
+        first = self._similarity(a['first_name'], b['first_name'])
+        last = self._similarity(last_a, last_b)
+
+        # A matching name is required; contact details alone (a shared
+        # household phone or email) are not enough to call it a duplicate.
+        # Different middle names or suffixes (Jr./Sr.) are different people.
+        if first is None or last is None or first < 0.75 or last < 0.85:
+            return 0.0
+        if self._conflict(a, b):
+            return 0.0
+
+        parts = {
+            'name': (first + last) / 2,
+            'middle_name': float(middle) if middle is not None else None,
+            'address': self._similarity(f"{a['address']} {a['city']}",
+                                        f"{b['address']} {b['city']}"),
+            'phone': float(bool(phones_a & phones_b)) if phones_a and phones_b else None,
+            'email': float(email_a == email_b) if email_a and email_b else None,
+            'council': float(str(a['council']) == str(b['council'])) if a['council'] and b['council'] else None
+        }
+
+        total = sum(SCORE_WEIGHTS[k] for k, v in parts.items() if v is not None)
+        return sum(SCORE_WEIGHTS[k] * v for k, v in parts.items() if v is not None) / total
+
+    def _load_knights(self, conn):
+        """Load every knight as a dict"""
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT {', '.join(KNIGHT_FIELDS)} FROM knights ORDER BY id")
+        return [dict(zip(KNIGHT_FIELDS, row)) for row in cursor]
+
+    def _candidate_pairs(self, knights):
+        """Yield candidate index pairs that share a blocking key"""
+        blocks = defaultdict(list)
+        for i, knight in enumerate(knights):
+            for key in self._blocking_keys(knight):
+                blocks[key].append(i)
+
+        seen = set()
+        for members in blocks.values():
+            if len(members) < 2:
+                continue
+            if len(members) > self.window:
+                # Sorted neighbourhood: only compare entries that are close
+                # together once the block is ordered by full name
+                members = sorted(members, key=lambda i: self._normalize_text(
+                    f"{knights[i]['last_name']} {knights[i]['first_name']} {knights[i]['middle_name']}"))
+            for pos, i in enumerate(members):
+                for j in members[pos + 1:pos + 1 + self.window]:
+                    pair = (min(i, j), max(i, j))
+                    if pair not in seen:
+                        seen.add(pair)
+                        yield pair
+
+    def find_duplicates(self):
+        """Return groups of knight ids that look like the same person"""
+        conn = sqlite3.connect(self.db_path)
+        knights = self._load_knights(conn)
+        conn.close()
+
+        # Union-find over matching pairs so chains collapse into one group
+        parent = list(range(len(knights)))
+        members = {i: [i] for i in range(len(knights))}
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        scores = {}
+        for i, j in self._candidate_pairs(knights):
+            pair_score = self.score(knights[i], knights[j])
+            if pair_score < self.threshold:
+                continue
+
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                if any(self._conflict(knights[x], knights[y])
+                       for x in members[root_i] for y in members[root_j]):
+                    continue
+                root, other = min(root_i, root_j), max(root_i, root_j)
+                parent[other] = root
+                members[root].extend(members.pop(other))
+            scores[(i, j)] = pair_score
+
+        groups = defaultdict(set)
+        group_scores = {}
+        for (i, j), pair_score in scores.items():
+            root = find(i)
+            groups[root].update((i, j))
+            group_scores[root] = min(group_scores.get(root, 1.0), pair_score)
+
+        duplicates = []
+        for root, members in groups.items():
+            members = sorted(members)
+            duplicates.append({
+                'keep': knights[members[0]],
+                'merge': [knights[m] for m in members[1:]],
+                'score': group_scores[root]
+            })
+        return sorted(duplicates, key=lambda d: d['keep']['id'])
+
+    def _existing_references(self, conn):
+        """Filter KNIGHT_REFERENCES (plus role_terms, if present) to the columns present in this database"""
+        cursor = conn.cursor()
+        references = []
+        for table, column in [*KNIGHT_REFERENCES, ('role_terms', 'knight_id')]:
+            cursor.execute(f'PRAGMA table_info("{table}")')
+            if column in [row[1] for row in cursor.fetchall()]:
+                references.append((table, column))
+        return references
+
+    def merge(self, duplicates):
+        """Merge each duplicate group into its lowest id in one transaction"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        references = self._existing_references(conn)
+        has_role_terms = ('role_terms', 'knight_id') in references
+        references = [reference for reference in references if reference[0] != 'role_terms']
+
+        try:
+            for group in duplicates:
+                keep_id = group['keep']['id']
+                merge_ids = [k['id'] for k in group['merge']]
+                placeholders = ','.join('?' * len(merge_ids))
+
+                # Fill in empty fields on the surviving row
+                updates = {}
+                for field in KNIGHT_FIELDS[1:]:
+                    if group['keep'][field] in (None, ''):
+                        for knight in group['merge']:
+                            if knight[field] not in (None, ''):
+                                updates[field] = knight[field]
+                                break
+                if updates:
+                    assignments = ', '.join(f'"{field}" = ?' for field in updates)
+                    cursor.execute(f'UPDATE "knights" SET {assignments} WHERE id = ?',
+                                   [*updates.values(), keep_id])
+
+                # Roles: carry over without violating the (knight_id, role_id) key
+                cursor.execute(f'INSERT OR IGNORE INTO "knights_roles" (knight_id, role_id) '
+                               f'SELECT ?, role_id FROM knights_roles WHERE knight_id IN ({placeholders})',
+                               [keep_id, *merge_ids])
+                cursor.execute(f'DELETE FROM "knights_roles" WHERE knight_id IN ({placeholders})', merge_ids)
+
+                # Terms: drop the ones the survivor (or a lower term id in the
+                # group) already has for that role and start year, then carry
+                # over the rest, so the directory does not list a term twice
+                if has_role_terms:
+                    cursor.execute(f'DELETE FROM "role_terms" WHERE knight_id IN ({placeholders}) AND EXISTS ('
+                                   f'SELECT 1 FROM role_terms t WHERE t.role_id = role_terms.role_id '
+                                   f'AND t.term_start = role_terms.term_start '
+                                   f'AND (t.knight_id = ? OR (t.knight_id IN ({placeholders}) AND t.id < role_terms.id)))',
+                                   [*merge_ids, keep_id, *merge_ids])
+                    cursor.execute(f'UPDATE "role_terms" SET knight_id = ? WHERE knight_id IN ({placeholders})',
+                                   [keep_id, *merge_ids])
+
+                for table, column in references:
+                    cursor.execute(f'UPDATE "{table}" SET "{column}" = ? WHERE "{column}" IN ({placeholders})',
+                                   [keep_id, *merge_ids])
+
+                cursor.execute(f'DELETE FROM "knights" WHERE id IN ({placeholders})', merge_ids)
+                print(f"Merged {merge_ids} into {keep_id}")
+
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            print(f"Database error: {e}")
+            raise
+        finally:
+            conn.close()
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Find and merge duplicate knights')
+    parser.add_argument('--database', default='ok_knights_directory.db',
+                        help='Database file path')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Minimum similarity score to treat two knights as duplicates')
+    parser.add_argument('--apply', action='store_true',
+                        help='Merge the duplicates instead of only listing them')
+
+    args = parser.parse_args()
+
+    if args.threshold <= EMAIL_MISMATCH_SCORE:
+        print(f"Warning: a threshold of {args.threshold} can merge relatives who share a name, address and phone")
+
+    deduplicator = KnightsDeduplicator(args.database, args.threshold)
+    duplicates = deduplicator.find_duplicates()
+
+    for group in duplicates:
+        keep = group['keep']
+        print(f"[{group['score']:.2f}] keep {keep['id']}: {keep['first_name']} {keep['last_name']}")
+        for knight in group['merge']:
+            print(f"        merge {knight['id']}: {knight['first_name']} {knight['last_name']}")
+
+    print(f"\nFound {len(duplicates)} duplicate group(s)")
+
+    if args.apply and duplicates:
+        deduplicator.merge(duplicates)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# pylint: disable=C0301
+"""
+Knights Schema Migrations
+
+Brings a directory database up to the current schema by applying the
+numbered migrations in ./migrations in order. Each migration is either a
+.sql script or a .py module with a migrate(conn) function, runs in its own
+transaction, and is recorded in the schema_migrations table (and mirrored in
+PRAGMA user_version) so it is never applied twice.
+
+Migrations are written to be idempotent (IF NOT EXISTS, DROP VIEW IF
+EXISTS, column checks) so they can also be applied to a database that was
+built by hand with the old create_*.sql scripts.
+
+Usage:
+python knights_migrate.py
+python knights_migrate.py --database /path/to/db.db
+python knights_migrate.py --status
+"""
+
+import argparse
+import importlib.util
+import os
+import re
+import sqlite3
+from datetime import datetime
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+
+MIGRATION_FILE = re.compile(r'^(\d{4})_(\w+)\.(sql|py)$')
+
+CREATE_SCHEMA_MIGRATIONS = """CREATE TABLE IF NOT EXISTS "schema_migrations" (
+	"version"	INTEGER NOT NULL UNIQUE,
+	"name"	TEXT NOT NULL,
+	"applied_at"	TEXT NOT NULL,
+	PRIMARY KEY("version")
+)"""
+
+
+class KnightsMigrator:
+    """Class to apply versioned schema migrations to the directory database"""
+
+    def __init__(self, db_path="ok_knights_directory.db", migrations_dir=MIGRATIONS_DIR):
+        self.db_path = db_path
+        self.migrations_dir = migrations_dir
+
+    def available_migrations(self):
+        """All migrations on disk as (version, name, path), in order"""
+        migrations = []
+        for filename in os.listdir(self.migrations_dir):
+            match = MIGRATION_FILE.match(filename)
+            if match:
+                migrations.append((int(match.group(1)), match.group(2),
+                                   os.path.join(self.migrations_dir, filename)))
+        migrations.sort()
+
+        versions = [m[0] for m in migrations]
+        if len(versions) != len(set(versions)):
+            raise ValueError(f"Duplicate migration version in {self.migrations_dir}")
+
+        return migrations
+
+    def _connect(self):
+        """Open a connection in autocommit mode so transactions are explicit"""
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        conn.execute(CREATE_SCHEMA_MIGRATIONS)
+        return conn
+
+    def applied_versions(self, conn):
+        """Versions already recorded in the database"""
+        return {row[0] for row in conn.execute("SELECT version FROM schema_migrations")}
+
+    def _apply(self, conn, version, name, path):
+        """Run one migration and record it, all in a single transaction"""
+        try:
+            if path.endswith('.sql'):
+                with open(path, 'r', encoding='utf-8') as sql_file:
+                    # executescript() commits any open transaction before it
+                    # runs, so the BEGIN has to be part of the script itself
+                    conn.executescript(f"BEGIN;\n{sql_file.read()}")
+            else:
+                conn.execute("BEGIN")
+                spec = importlib.util.spec_from_file_location(f"migration_{version:04d}", path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                module.migrate(conn)
+
+            conn.execute("INSERT INTO schema_migrations (version, name, applied_at) VALUES (?, ?, ?)",
+                         (version, name, datetime.now().isoformat(timespec='seconds')))
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.execute("COMMIT")
+
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+
+    def migrate(self, target=None):
+        """Apply every pending migration up to target (default: all); returns the versions applied"""
+        conn = self._connect()
+        applied = []
+        try:
+            done = self.applied_versions(conn)
+            for version, name, path in self.available_migrations():
+                if version in done or (target is not None and version > target):
+                    continue
+                print(f"Applying {version:04d}_{name}")
+                self._apply(conn, version, name, path)
+                applied.append(version)
+        finally:
+            conn.close()
+
+        return applied
+
+    def status(self):
+        """List every migration with whether it has been applied"""
+        conn = self._connect()
+        try:
+            done = self.applied_versions(conn)
+        finally:
+            conn.close()
+
+        return [(version, name, version in done) for version, name, _ in self.available_migrations()]
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Apply schema migrations to the Knights directory database')
+    parser.add_argument('--database', default='ok_knights_directory.db',
+                        help='Database file path')
+    parser.add_argument('--target', type=int,
+                        help='Only migrate up to this version')
+    parser.add_argument('--status', action='store_true',
+                        help='List migrations and whether they have been applied')
+
+    args = parser.parse_args()
+
+    migrator = KnightsMigrator(args.database)
+
+    if args.status:
+        for version, name, applied in migrator.status():
+            print(f"{version:04d}_{name:<30} {'applied' if applied else 'pending'}")
+        return
+
+    applied = migrator.migrate(args.target)
+    print(f"Applied {len(applied)} migration(s)" if applied else "Database is up to date")
+
+if __name__ == "__main__":
+    main()
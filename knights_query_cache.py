@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# pylint: disable=C0301
+"""
+Knights Query Cache
+
+Caches the result rows of read-only queries against the directory database so
+repeated runs (the generator, the playground notebook) do not re-execute the
+views while nothing has changed.
+
+Entries are keyed on the query text and parameters and tagged with the
+database's content version. The version comes from the SQLite file header's
+change counter (which every committed write increments) together with the
+size and modification time of the database and its -wal file. PRAGMA
+data_version is not used for this: its value is only comparable within a
+single connection, so it cannot validate entries across connections or runs.
+Any write to the database changes the version, and every cached entry is
+dropped the next time the cache is read.
+
+Entries are kept in memory with LRU eviction and can optionally be persisted
+to a zlib-compressed marshal file next to the database. marshal only
+rebuilds plain values (no classes or callables, unlike pickle), and the
+loaded payload is checked entry by entry; a cache file that does not have the
+expected shape is ignored.
+
+Usage:
+cache = QueryCache('ok_knights_directory.db', persist_path='ok_knights_directory.db.cache')
+rows = cache.fetch("SELECT * FROM StateOfficerView")
+cache.save()
+"""
+
+import marshal
+import os
+import sqlite3
+import zlib
+from collections import OrderedDict
+
+CACHE_FORMAT_VERSION = 2
+
+# Offset and size of the "file change counter" in the SQLite database header
+CHANGE_COUNTER_OFFSET = 24
+CHANGE_COUNTER_SIZE = 4
+
+
+def content_version(db_path):
+    """Token that changes whenever the content of the database at db_path changes"""
+    with open(db_path, 'rb') as db_file:
+        db_file.seek(CHANGE_COUNTER_OFFSET)
+        counter = int.from_bytes(db_file.read(CHANGE_COUNTER_SIZE), 'big')
+
+    stat = os.stat(db_path)
+    version = (counter, stat.st_size, stat.st_mtime_ns)
+
+    # In WAL mode commits land in the -wal file before the header changes
+    wal_path = f"{db_path}-wal"
+    if os.path.exists(wal_path):
+        wal_stat = os.stat(wal_path)
+        version += (wal_stat.st_size, wal_stat.st_mtime_ns)
+
+    return version
+
+
+class QueryCache:
+    """Class to cache query results until the database content changes"""
+
+    def __init__(self, db_path="ok_knights_directory.db", max_entries=64, persist_path=None):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.persist_path = persist_path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._version = None
+
+        if persist_path:
+            self._load()
+
+    def _content_version(self):
+        """Token that changes whenever the database content changes"""
+        return content_version(self.db_path)
+
+    def _validate(self):
+        """Drop every entry if the database changed since they were stored"""
+        version = self._content_version()
+        if version != self._version:
+            self._entries.clear()
+            self._version = version
+
+    def fetch(self, query, params=()):
+        """Return all rows for query, from the cache when the database is unchanged"""
+        self._validate()
+
+        key = (query, tuple(params))
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+        finally:
+            conn.close()
+
+        self._entries[key] = rows
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        return rows
+
+    def clear(self):
+        """Forget every cached result"""
+        self._entries.clear()
+        self._version = None
+
+    @staticmethod
+    def _valid_payload(payload):
+        """True if payload has the shape save() writes"""
+        version, entries = payload.get('version'), payload.get('entries')
+        if not isinstance(version, tuple) or not all(isinstance(v, int) for v in version):
+            return False
+        if not isinstance(entries, list):
+            return False
+
+        for entry in entries:
+            if not (isinstance(entry, tuple) and len(entry) == 2):
+                return False
+            key, rows = entry
+            if not (isinstance(key, tuple) and len(key) == 2
+                    and isinstance(key[0], str) and isinstance(key[1], tuple)):
+                return False
+            if not (isinstance(rows, list) and all(isinstance(row, tuple) for row in rows)):
+                return False
+            values = key[1] + tuple(value for row in rows for value in row)
+            if not all(value is None or isinstance(value, (int, float, str, bytes)) for value in values):
+                return False
+
+        return True
+
+    def _load(self):
+        """Load persisted entries, ignoring a missing, stale or unreadable file"""
+        if not os.path.exists(self.persist_path):
+            return
+
+        try:
+            with open(self.persist_path, 'rb') as cache_file:
+                payload = marshal.loads(zlib.decompress(cache_file.read()))
+        except (OSError, zlib.error, ValueError, EOFError, TypeError) as e:
+            print(f"Warning: Could not read query cache {self.persist_path}: {e}")
+            return
+
+        if not isinstance(payload, dict):
+            print(f"Warning: Ignoring malformed query cache {self.persist_path}")
+            return
+        if payload.get('format') != CACHE_FORMAT_VERSION:
+            return
+        if not self._valid_payload(payload):
+            print(f"Warning: Ignoring malformed query cache {self.persist_path}")
+            return
+
+        self._version = payload['version']
+        self._entries = OrderedDict(payload['entries'])
+        self._validate()
+
+    def save(self):
+        """Write the current entries to persist_path"""
+        if not self.persist_path:
+            return
+
+        self._validate()
+        payload = {
+            'format': CACHE_FORMAT_VERSION,
+            'version': self._version,
+            'entries': list(self._entries.items())
+        }
+
+        # Write then rename so a crash never leaves a truncated cache behind
+        tmp_path = f"{self.persist_path}.tmp"
+        with open(tmp_path, 'wb') as cache_file:
+            cache_file.write(zlib.compress(marshal.dumps(payload)))
+        os.replace(tmp_path, self.persist_path)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# pylint: disable=C0301
+"""
+Knights Role History
+
+Historical roster queries over the role_terms table (see
+migrations/0003_role_terms.sql). Terms are stored as fraternal years, so a term
+of 2019-2021 has term_start 2019 and term_end 2021; a NULL term_end means the
+term is still running. Every query filters on role_id and the term columns,
+which is what idx_role_terms_role_term covers.
+
+Usage:
+python knights_role_history.py --role "State Deputy" --year 2015
+python knights_role_history.py --role "State Deputy" --living
+"""
+
+import argparse
+import sqlite3
+
+HISTORY_FIELDS = ['knight_id', 'full_name', 'role', 'term_start', 'term_end', 'deceased']
+
+HISTORY_SELECT = """SELECT k.id,
+       k.first_name || ' ' || k.last_name,
+       r.role,
+       rt.term_start,
+       rt.term_end,
+       k.deceased
+FROM role_terms rt
+INNER JOIN knights k ON rt.knight_id = k.id
+INNER JOIN roles r ON rt.role_id = r.id
+"""
+
+
+class RoleHistory:
+    """Class to answer historical roster questions from role_terms"""
+
+    def __init__(self, db_path="ok_knights_directory.db"):
+        self.db_path = db_path
+
+    def _role_id(self, cursor, role):
+        """Accept either a role id or a role name"""
+        if isinstance(role, int):
+            return role
+        cursor.execute("SELECT id FROM roles WHERE role = ? COLLATE NOCASE", (role,))
+        row = cursor.fetchone()
+        if row is None:
+            raise ValueError(f"Unknown role: {role}")
+        return row[0]
+
+    def _query(self, role, where, params):
+        """Run a role_terms query for one role and return dicts"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            role_id = self._role_id(cursor, role)
+            cursor.execute(f"{HISTORY_SELECT} WHERE rt.role_id = ? {where} ORDER BY rt.term_start",
+                           [role_id, *params])
+            return [dict(zip(HISTORY_FIELDS, row)) for row in cursor]
+        finally:
+            conn.close()
+
+    def holders(self, role, year):
+        """Who held role in the given year"""
+        return self._query(role,
+                           "AND rt.term_start <= ? AND (rt.term_end IS NULL OR rt.term_end >= ?)",
+                           [year, year])
+
+    def past_holders(self, role, living=None):
+        """Everyone whose term in role has ended, optionally only living or deceased"""
+        where = "AND rt.term_end IS NOT NULL AND rt.term_end <= CAST(strftime('%Y', 'now') AS INTEGER)"
+        if living is True:
+            where += " AND COALESCE(k.deceased, 0) != 1"
+        elif living is False:
+            where += " AND k.deceased = 1"
+        return self._query(role, where, [])
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Query the role history of the directory database')
+    parser.add_argument('--database', default='ok_knights_directory.db',
+                        help='Database file path')
+    parser.add_argument('--role', default='State Deputy',
+                        help='Role name or id')
+    parser.add_argument('--year', type=int,
+                        help='List who held the role in this year (default: everyone whose term has ended)')
+    parser.add_argument('--living', action='store_true',
+                        help='Without --year, only list living past holders')
+
+    args = parser.parse_args()
+    role = int(args.role) if args.role.isdigit() else args.role
+
+    history = RoleHistory(args.database)
+    if args.year is not None:
+        rows = history.holders(role, args.year)
+    else:
+        rows = history.past_holders(role, living=True if args.living else None)
+
+    for row in rows:
+        term = f"{row['term_start']}-{row['term_end'] or ''}"
+        print(f"{term:<10} {row['full_name']}{' (deceased)' if row['deceased'] == 1 else ''}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# pylint: disable=C0301
+"""
+Knights Directory Output Verification
+
+Builds the directory from a fixed benchmark database (made with
+make_benchmark_db.py) and compares its
+structure (page count, section anchors and order, the page each section
+starts on, entries per section and each entry's label) against a stored
+baseline. Changes to the table layouts, the views or the generator's
+performance paths (--stream, --cache) can then be checked for silently moved
+or dropped rows without reading the PDF.
+
+The model is recorded by the generator while it builds, and the page count is
+cross-checked against the page objects in the written PDF. PDFs are built
+with reportlab's invariant mode, so an unchanged directory also has an
+identical SHA-256; that hash is reported but only --exact fails on it.
+
+The directory year (title page, which past state deputy terms have ended)
+is recorded in the baseline and every later build is pinned to it, so a
+baseline does not drift when the calendar year changes.
+
+Usage:
+python make_benchmark_db.py --database benchmark.db
+python knights_verify.py --database benchmark.db --update
+python knights_verify.py --database benchmark.db
+python knights_verify.py --database benchmark.db --stream --cache
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from collections import Counter
+
+from reportlab import rl_config
+
+from knights_database_generator import KnightsDirectoryGenerator
+from knights_query_cache import QueryCache
+
+PDF_PAGE_OBJECT = re.compile(rb'/Type\s*/Page(?![a-zA-Z])')
+
+# Bumped when the recorded model changes shape; baselines must be re-recorded
+MODEL_FORMAT = 3
+
+
+def _sha256(path):
+    """SHA-256 of a file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def count_pdf_pages(pdf_path):
+    """Count page objects in a PDF written by reportlab (object dictionaries are not compressed)"""
+    with open(pdf_path, 'rb') as f:
+        return len(PDF_PAGE_OBJECT.findall(f.read()))
+
+
+def build_model(db_path, image_path, out_dir, stream=False, cache=False, year=None):
+    """Build the directory for year (default: the current year) and return its structural model"""
+    rl_config.invariant = 1
+    query_cache = QueryCache(db_path) if cache else None
+    generator = KnightsDirectoryGenerator(db_path, image_path, query_cache, year=year)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        pdf_filename = generator.generate_document(os.path.join(out_dir, 'verify'), stream=stream)
+    elapsed = time.perf_counter() - start
+
+    model = {'format': MODEL_FORMAT, 'year': generator.year, **generator.directory_model}
+    model['pdf_pages'] = count_pdf_pages(pdf_filename)
+    model['pdf_sha256'] = _sha256(pdf_filename)
+    model['database_sha256'] = _sha256(db_path)
+    model['build_seconds'] = round(elapsed, 3)
+    return model
+
+
+def diff_models(baseline, current):
+    """List every structural difference between two models"""
+    differences = []
+
+    if baseline['database_sha256'] != current['database_sha256']:
+        differences.append("benchmark database differs from the one the baseline was recorded against")
+
+    if baseline['year'] != current['year']:
+        differences.append(f"directory year: {baseline['year']} -> {current['year']}")
+
+    if baseline['pages'] != current['pages']:
+        differences.append(f"page count: {baseline['pages']} -> {current['pages']}")
+    if current['pdf_pages'] != current['pages']:
+        differences.append(f"PDF has {current['pdf_pages']} page objects but the build reported {current['pages']}")
+
+    old_sections = {s['anchor']: s for s in baseline['sections']}
+    new_sections = {s['anchor']: s for s in current['sections']}
+
+    for anchor in old_sections.keys() - new_sections.keys():
+        differences.append(f"section removed: {anchor}")
+    for anchor in new_sections.keys() - old_sections.keys():
+        differences.append(f"section added: {anchor}")
+
+    common = [a for a in old_sections if a in new_sections]
+    if common != [a for a in new_sections if a in old_sections]:
+        differences.append(f"section order: {common} -> {[a for a in new_sections if a in old_sections]}")
+
+    for anchor in common:
+        old, new = old_sections[anchor], new_sections[anchor]
+        if old['page'] != new['page']:
+            differences.append(f"{anchor}: starts on page {old['page']} -> {new['page']}")
+        if old['entries'] != new['entries']:
+            differences.append(f"{anchor}: {old['entries']} -> {new['entries']} entries")
+
+        old_labels, new_labels = Counter(old['labels']), Counter(new['labels'])
+        for label in (old_labels - new_labels).elements():
+            differences.append(f"{anchor}: missing entry '{label}'")
+        for label in (new_labels - old_labels).elements():
+            differences.append(f"{anchor}: new entry '{label}'")
+        if old_labels == new_labels and old['labels'] != new['labels']:
+            differences.append(f"{anchor}: entries reordered")
+
+    return differences
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Check a generated directory against a stored structural baseline')
+    parser.add_argument('--database', default='benchmark.db',
+                        help='Benchmark database file path')
+    parser.add_argument('--image', default='kofc_logo.png',
+                        help='Logo image file path')
+    parser.add_argument('--baseline',
+                        help='Baseline JSON file (default: <database without extension>.baseline.json)')
+    parser.add_argument('--update', action='store_true',
+                        help='Record the current output as the new baseline')
+    parser.add_argument('--stream', action='store_true',
+                        help='Build with the streaming story path')
+    parser.add_argument('--cache', action='store_true',
+                        help='Build with the query result cache')
+    parser.add_argument('--exact', action='store_true',
+                        help='Also fail if the PDF bytes differ from the baseline')
+    parser.add_argument('--year', type=int,
+                        help='Directory year to build (default: the baseline\'s, or the current year with --update)')
+
+    args = parser.parse_args()
+    baseline_path = args.baseline or f"{os.path.splitext(args.database)[0]}.baseline.json"
+
+    if not os.path.exists(args.database):
+        print(f"Database file not found: {args.database} (build one with make_benchmark_db.py)")
+        sys.exit(1)
+
+    if args.update:
+        with tempfile.TemporaryDirectory() as out_dir:
+            current = build_model(args.database, args.image, out_dir, stream=args.stream, cache=args.cache,
+                                  year=args.year)
+        with open(baseline_path, 'w', encoding='utf-8') as baseline_file:
+            json.dump(current, baseline_file, indent=2)
+        print(f"Baseline saved as: {baseline_path} ({current['year']} directory, {current['pages']} pages, "
+              f"{sum(s['entries'] for s in current['sections'])} entries)")
+        return
+
+    if not os.path.exists(baseline_path):
+        print(f"Baseline not found: {baseline_path} (record one with --update)")
+        sys.exit(1)
+
+    with open(baseline_path, 'r', encoding='utf-8') as baseline_file:
+        baseline = json.load(baseline_file)
+
+    if baseline.get('format') != MODEL_FORMAT:
+        print(f"Baseline {baseline_path} was recorded in an older format; re-record it with --update")
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        current = build_model(args.database, args.image, out_dir, stream=args.stream, cache=args.cache,
+                              year=args.year or baseline['year'])
+
+    start = time.perf_counter()
+    differences = diff_models(baseline, current)
+    if args.exact and baseline['pdf_sha256'] != current['pdf_sha256']:
+        differences.append("PDF bytes differ from the baseline")
+    diff_ms = (time.perf_counter() - start) * 1000
+
+    print(f"Build: {current['build_seconds']:.2f}s (baseline {baseline['build_seconds']:.2f}s), diff: {diff_ms:.1f} ms")
+    print(f"PDF identical to baseline: {baseline['pdf_sha256'] == current['pdf_sha256']}")
+
+    if differences:
+        print(f"{len(differences)} difference(s):")
+        for difference in differences:
+            print(f"  {difference}")
+        sys.exit(1)
+
+    print("Output matches baseline")
+
+if __name__ == "__main__":
+    main()
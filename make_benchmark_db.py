@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# pylint: disable=C0301
+"""
+Knights Benchmark Database
+
+Builds the synthetic database knights_verify.py checks the generator against.
+Every row is derived from its index (no randomness, no dates), and the
+migration timestamps are pinned, so the same arguments always give a
+byte-identical file on every machine.
+
+It fills every directory section: state officers, program directors,
+district deputies, councils with their grand knights and financial
+secretaries, past state deputies (some deceased, with widows) and insurance
+agents. The migrations do not define AgentsView, so the benchmark adds an
+'Insurance Agent' role and a stand-in view with the columns the generator
+reads.
+
+Usage:
+python make_benchmark_db.py
+python make_benchmark_db.py --database benchmark.db --districts 40
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sqlite3
+
+from knights_migrate import KnightsMigrator
+
+FIRST_NAMES = ['John', 'Michael', 'Joseph', 'Thomas', 'James', 'Robert', 'Daniel', 'Paul', 'Mark', 'Peter']
+LAST_NAMES = ['Smith', 'Johnson', 'Brown', 'Miller', 'Davis', 'Garcia', 'Wilson', 'Moore', 'Taylor', 'Clark',
+              'Lewis', 'Walker']
+WIVES = ['Mary', 'Anne', 'Teresa', 'Elizabeth', 'Rose', 'Catherine', 'Margaret']
+CITIES = [('Oklahoma City', 73101), ('Tulsa', 74101), ('Norman', 73069), ('Lawton', 73501), ('Enid', 73701)]
+
+STATE_OFFICER_ROLES = range(1, 11)
+# Roles listed by ProgramDirectorView; 44 and 45 are left vacant
+PROGRAM_ROLES = [27, 46, 48, 69, 70, 36, 49, 47, 52, 28, 68, 42, 29, 30, 35, 41, 40, 38, 37, 39, 43]
+DISTRICT_DEPUTY_ROLE = 11
+STATE_DEPUTY_ROLE = 2
+AGENT_ROLE = (90, 'Insurance Agent')
+
+# Fixed so the file does not change with the day it was built
+APPLIED_AT = '2000-01-01T00:00:00'
+FIRST_TERM = 1980
+
+AGENTS_VIEW = """CREATE VIEW "AgentsView" AS
+SELECT
+	k.first_name || ' ' || k.last_name as "name",
+	k.wife as "wife",
+	k.email as "email",
+	k.council as "council",
+	k.primary_phone as "phone",
+	(SELECT group_concat(c.council_number, ',') FROM councils c WHERE c.district_id = k.id % 7 + 1) as "councils_represented",
+	r.role as "role",
+	k.address as "address",
+	k.city as "city",
+	k.state as "state",
+	k.zipcode as "zip"
+FROM knights k
+INNER JOIN knights_roles kr ON k.id = kr.knight_id
+INNER JOIN roles r ON kr.role_id = r.id
+WHERE r.id = {role_id}
+ORDER BY k.last_name, k.first_name"""
+
+
+def _knight(knight_id, councils):
+    """Row for knights, derived only from its id"""
+    city, zipcode = CITIES[knight_id % len(CITIES)]
+    return (knight_id,
+            FIRST_NAMES[knight_id % len(FIRST_NAMES)],
+            LAST_NAMES[(knight_id // len(FIRST_NAMES)) % len(LAST_NAMES)] + (f"-{knight_id}" if knight_id > 100 else ''),
+            WIVES[knight_id % len(WIVES)] if knight_id % 3 else None,
+            f"{100 + knight_id} Main St",
+            city, zipcode,
+            f"405555{knight_id:04d}",
+            f"knight{knight_id}@example.com",
+            0,
+            'Oklahoma',
+            1000 + knight_id % councils)
+
+
+def build_benchmark_db(db_path, districts=20, councils_per_district=3, past_state_deputies=20, agents=12):
+    """Create db_path from the migrations and fill it; returns the number of knights"""
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        KnightsMigrator(db_path).migrate()
+
+    councils = districts * councils_per_district
+    # Officers, directors, deputies, one GK and FS per council, PSDs and agents
+    knights = len(STATE_OFFICER_ROLES) + len(PROGRAM_ROLES) + districts + 2 * councils + past_state_deputies + agents
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("UPDATE schema_migrations SET applied_at = ?", (APPLIED_AT,))
+        conn.executemany("INSERT INTO knights (id, first_name, last_name, wife, address, city, zipcode, primary_phone, email, deceased, state, council) "
+                         "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                         [_knight(i, councils) for i in range(1, knights + 1)])
+
+        next_id = iter(range(1, knights + 1))
+        conn.executemany("INSERT INTO knights_roles (knight_id, role_id) VALUES (?, ?)",
+                         [(next(next_id), role) for role in [*STATE_OFFICER_ROLES, *PROGRAM_ROLES]])
+
+        deputies = [next(next_id) for _ in range(districts)]
+        conn.executemany("INSERT INTO districts (id, number, dd_id) VALUES (?, ?, ?)",
+                         [(d, d, knight_id) for d, knight_id in enumerate(deputies, 1)])
+        conn.executemany("INSERT INTO knights_roles (knight_id, role_id) VALUES (?, ?)",
+                         [(knight_id, DISTRICT_DEPUTY_ROLE) for knight_id in deputies])
+
+        council_rows = []
+        for c in range(councils):
+            gk_id, fs_id = next(next_id), next(next_id)
+            city = CITIES[c % len(CITIES)][0]
+            council_rows.append((1000 + c, f"{city} Council {c + 1}", f"St. {FIRST_NAMES[c % len(FIRST_NAMES)]} Parish",
+                                 f"{200 + c} Church St", city, f"Thursday {7 + c % 3}:00 PM",
+                                 c // councils_per_district + 1, gk_id, fs_id))
+        conn.executemany("INSERT INTO councils (council_number, council_name, parish, address, city, meeting_time, district_id, gk_id, fs_id) "
+                         "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", council_rows)
+        conn.executemany("INSERT INTO knights_roles (knight_id, role_id) VALUES (?, ?)",
+                         [(row[7], 75) for row in council_rows] + [(row[8], 77) for row in council_rows])
+
+        terms = []
+        for t in range(past_state_deputies):
+            knight_id = next(next_id)
+            terms.append((knight_id, STATE_DEPUTY_ROLE, FIRST_TERM + 2 * t, FIRST_TERM + 2 * t + 2))
+            if t % 4 == 0:
+                conn.execute("UPDATE knights SET deceased = 1, wife = ? WHERE id = ?", (WIVES[t % len(WIVES)], knight_id))
+        conn.executemany("INSERT INTO role_terms (knight_id, role_id, term_start, term_end) VALUES (?, ?, ?, ?)", terms)
+
+        conn.execute("INSERT OR IGNORE INTO roles (id, role) VALUES (?, ?)", AGENT_ROLE)
+        conn.executemany("INSERT INTO knights_roles (knight_id, role_id) VALUES (?, ?)",
+                         [(next(next_id), AGENT_ROLE[0]) for _ in range(agents)])
+        conn.execute(AGENTS_VIEW.format(role_id=AGENT_ROLE[0]))
+
+        conn.commit()
+    finally:
+        conn.close()
+
+    return knights
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Build the deterministic benchmark database for knights_verify.py')
+    parser.add_argument('--database', default='benchmark.db',
+                        help='Database file to (re)create')
+    parser.add_argument('--districts', type=int, default=20,
+                        help='Number of districts (three councils each)')
+    parser.add_argument('--past-state-deputies', type=int, default=20,
+                        help='Number of past state deputy terms')
+    parser.add_argument('--agents', type=int, default=12,
+                        help='Number of insurance agents')
+
+    args = parser.parse_args()
+
+    knights = build_benchmark_db(args.database, districts=args.districts,
+                                 past_state_deputies=args.past_state_deputies, agents=args.agents)
+    print(f"Benchmark database saved as: {args.database} ({knights} knights)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+-- BASE TABLES
+-- Safe to run against a database created by the old create_*.sql scripts.
+
+-- COUNCILS
+CREATE TABLE IF NOT EXISTS "councils" (
+	"id"	INTEGER NOT NULL UNIQUE,
+	"council_number"	INTEGER,
+	"council_name"	TEXT,
+	"parish"	TEXT,
+	"address"	TEXT,
+	"city"	TEXT,
+	"meeting_time"	TEXT,
+	"district_id"	INTEGER,
+	PRIMARY KEY("id" AUTOINCREMENT)
+);
+
+-- DISTRICTS
+CREATE TABLE IF NOT EXISTS "districts" (
+	"id"	INTEGER NOT NULL UNIQUE,
+	"number"	INTEGER NOT NULL,
+	"dd_id"	INTEGER,
+	PRIMARY KEY("id" AUTOINCREMENT),
+	FOREIGN KEY("dd_id") REFERENCES "knights"("id") ON DELETE SET NULL
+);
+
+-- KNIGHTS
+CREATE TABLE IF NOT EXISTS "knights" (
+	"id"	INTEGER,
+	"first_name"	TEXT,
+	"middle_name"	TEXT,
+	"last_name"	TEXT,
+	"wife"	TEXT,
+	"address"	TEXT,
+	"city"	TEXT,
+	"zipcode"	INTEGER,
+	"primary_phone"	TEXT,
+	"secondary_phone"	TEXT,
+	"email"	TEXT,
+	"deceased"	INTEGER,
+	"state"	text,
+	"council"	NUMERIC,
+	PRIMARY KEY("id" AUTOINCREMENT)
+);
+
+-- ROLES
+CREATE TABLE IF NOT EXISTS "roles" (
+	"id"	INTEGER NOT NULL UNIQUE,
+	"role"	TEXT,
+	PRIMARY KEY("id" AUTOINCREMENT)
+);
+
+-- KNIGHTS_ROLES JUNCTION
+CREATE TABLE IF NOT EXISTS "knights_roles" (
+	"knight_id"	INTEGER,
+	"role_id"	INTEGER,
+	PRIMARY KEY("knight_id","role_id"),
+	FOREIGN KEY("knight_id") REFERENCES "knights"("id"),
+	FOREIGN KEY("role_id") REFERENCES "roles"("id")
+);
+
+-- ROLES (PERMANENT SO CAN PUT HERE)
+INSERT OR IGNORE INTO "roles" ("id","role") VALUES
+ (1,'State Chaplain'),
+ (2,'State Deputy'),
+ (3,'Immediate Past State Deputy'),
+ (4,'State Secretary'),
+ (5,'State Treasurer'),
+ (6,'State Advocate'),
+ (7,'State Warden'),
+ (8,'Vice Supreme Master - 4th Degree'),
+ (9,'District Master - 4th Degree'),
+ (10,'Regional Growth Director'),
+ (11,'District Deputy'),
+ (12,'Executive Secretary'),
+ (13,'State Membership Director'),
+ (14,'Assistant State Membership Director - East'),
+ (15,'Assistant State Membership Director - West'),
+ (16,'State Online Director'),
+ (17,'State Online Chairman - East'),
+ (18,'State Online Chairman - West'),
+ (19,'State Membership Retention Director'),
+ (20,'State Reactivation Chairman'),
+ (21,'State New Council Development Chairman'),
+ (22,'State Retention and Round Table Chairman'),
+ (23,'Hispanic Chairman'),
+ (24,'Hispanic Coordinator - East'),
+ (25,'Hispanic Coordinator - West'),
+ (26,'Ceremonials and Protocol Director'),
+ (27,'State Program Director'),
+ (28,'Faith Director'),
+ (29,'RSVP Chairman - OKC'),
+ (30,'RSVP Chairman - Tulsa'),
+ (31,'Pilgrim Icon Program'),
+ (32,'Go Life Liaison - East'),
+ (33,'Pennies for Heaven / 365 Club Chairman'),
+ (34,'Spiritual Reflection Program Chairman'),
+ (35,'Community Director'),
+ (36,'Intellectual Disabilities Chairman'),
+ (37,'Soccer Challenge Chairman'),
+ (38,'State Free Throw Tournament Chairman'),
+ (39,'Disaster Response Chairman'),
+ (40,'Coats 4 Kids Chairman'),
+ (41,'State Golf Tournament Chairman'),
+ (42,'Keep Christ in Christmas Chairman'),
+ (43,'Family Director'),
+ (44,'Food 4 Families Chairman'),
+ (45,'Family of the Month Chairman'),
+ (46,'Life Director'),
+ (47,'Ultrasound Initiative Chairman'),
+ (48,'Silver Rose Chairman'),
+ (49,'Special Olympics Chairman'),
+ (50,'Novena for Life Chairman'),
+ (51,'Annual Go Life Gala Committee (K of C Liaison)'),
+ (52,'Center of Family Love Support Chairman'),
+ (53,'Center of Family Love Support Directors Co-Chairman - Tulsa'),
+ (54,'Catholic Education Support Director'),
+ (55,'Awards/Report Forms Director'),
+ (56,'Father McGivney Guild Chairman'),
+ (57,'Knights on Bikes - Oklahoma President'),
+ (58,'Knights on Bikes Director - OKC'),
+ (59,'Knights on Bikes Director - Tulsa'),
+ (60,'Marketing & Public Relations Chairman'),
+ (61,'Oklahoma Knight Editor'),
+ (62,'State Training Director'),
+ (63,'State Directory Chairman'),
+ (64,'Past State Deputy'),
+ (65,'Former State Chaplain'),
+ (68,'Icons Chairman'),
+ (69,'March 4 Life Chairman - OKC'),
+ (70,'March 4 Life Chairman - Tulsa'),
+ (75,'Grand Knight'),
+ (76,'Deputy Grand Knight'),
+ (77,'Financial Secretary');
+
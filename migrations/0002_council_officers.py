@@ -0,0 +1,20 @@
+"""
+Declare the columns the import scripts already rely on:
+councils.gk_id / councils.fs_id (see insert_knights.py) and knights.assembly
+(see knights_playground.ipynb). SQLite has no ADD COLUMN IF NOT EXISTS, so
+only the missing ones are added.
+"""
+
+NEW_COLUMNS = [
+    ('councils', 'gk_id', 'INTEGER REFERENCES "knights"("id") ON DELETE SET NULL'),
+    ('councils', 'fs_id', 'INTEGER REFERENCES "knights"("id") ON DELETE SET NULL'),
+    ('knights', 'assembly', 'INTEGER')
+]
+
+
+def migrate(conn):
+    """Add each column that is not already present"""
+    for table, column, definition in NEW_COLUMNS:
+        existing = [row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')]
+        if column not in existing:
+            conn.execute(f'ALTER TABLE "{table}" ADD COLUMN "{column}" {definition}')
@@ -0,0 +1,15 @@
+-- ROLE TERMS (ROLE HISTORY)
+-- Terms are fraternal years: 2019-2021 is term_start 2019, term_end 2021.
+-- A NULL term_end means the term is still running.
+CREATE TABLE IF NOT EXISTS "role_terms" (
+	"id"	INTEGER NOT NULL UNIQUE,
+	"knight_id"	INTEGER NOT NULL,
+	"role_id"	INTEGER NOT NULL,
+	"term_start"	INTEGER NOT NULL,
+	"term_end"	INTEGER,
+	PRIMARY KEY("id" AUTOINCREMENT),
+	FOREIGN KEY("knight_id") REFERENCES "knights"("id"),
+	FOREIGN KEY("role_id") REFERENCES "roles"("id")
+);
+CREATE INDEX IF NOT EXISTS "idx_role_terms_role_term" ON "role_terms" ("role_id", "term_start", "term_end");
+CREATE INDEX IF NOT EXISTS "idx_role_terms_knight" ON "role_terms" ("knight_id");
@@ -0,0 +1,5 @@
+-- INDEXES FOR THE DIRECTORY VIEWS' JOIN COLUMNS
+CREATE INDEX IF NOT EXISTS "idx_knights_council" ON "knights" ("council");
+CREATE INDEX IF NOT EXISTS "idx_councils_council_number" ON "councils" ("council_number");
+CREATE INDEX IF NOT EXISTS "idx_councils_district_id" ON "councils" ("district_id");
+CREATE INDEX IF NOT EXISTS "idx_knights_roles_role_id" ON "knights_roles" ("role_id");
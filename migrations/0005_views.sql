@@ -0,0 +1,184 @@
+-- VIEWS
+-- One definition per view, reconciling the copies that had drifted apart
+-- between create_database.sql and the per-view scripts.
+
+-- DISTRICTS VIEW
+DROP VIEW IF EXISTS "DistrictsView";
+CREATE VIEW "DistrictsView" as
+SELECT 
+    d.number,
+    k.first_name || ' ' || k.last_name AS "district_deputy",
+	k.address || "|" || k.city || "|" || k.state || "|" || k.zipcode as "address",
+	k.primary_phone as "phone",
+    k.email as "email",
+	k.council as "home_council",
+	group_concat(c.council_number || ',' || c.city, '|') as "councils",
+	k.wife as "wife"
+FROM districts d
+LEFT JOIN knights k ON d.dd_id = k.id
+INNER JOIN councils c ON c.district_id = d.id
+GROUP BY d.number;
+
+-- KNIGHTS VIEW
+DROP VIEW IF EXISTS "KnightsView";
+CREATE VIEW "KnightsView" AS 
+select 
+	k.first_name || ' ' || k.last_name as "Name",
+	k.wife as "Wife",
+	k.address as "Address",
+	k.city as "City",
+	k.state as "State",
+	k.zipcode as "Zip Code",
+	k.primary_phone as "Phone",
+	k.email as "Email",
+	c.district_id as "District",
+	group_concat(r.role, ', ') as "Roles"
+from knights k
+left join knights_roles kr on k.id = kr.knight_id 
+inner join roles r on kr.role_id = r.id
+left join councils c on k.council = c.council_number
+
+where k.deceased != 1
+
+group by k.id
+order by min(r.id);
+
+-- PROGRAM DIRECTORS VIEW
+-- Column order matches KnightsDirectoryGenerator._program_director_from_row
+DROP VIEW IF EXISTS "ProgramDirectorView";
+CREATE VIEW "ProgramDirectorView" AS
+SELECT
+    r.role as "role",
+    k.first_name || ' ' || k.last_name as "full_name",
+    k.wife as "wife",
+    k.address as "address",
+    k.city || ', ' || k.state || ' ' || k.zipcode as "city_state_zip",
+    k.primary_phone as "phone",
+    k.email as "email",
+    k.council as "council"
+FROM roles r
+LEFT JOIN knights_roles kr on r.id = kr.role_id
+LEFT JOIN knights k on kr.knight_id = k.id
+WHERE r.role COLLATE NOCASE IN (
+	"State Membership Growth Director",
+	"State Online Coordinator",
+	"State Roundtable Chairman",
+    "State Program Director",
+    "Life Director",
+    "Silver Rose Chairman",
+    "March 4 Life Chairman - OKC",
+    "March 4 Life Chairman - Tulsa",
+    "Intellectual Disabilities Chairman",
+    "Special Olympics Chairman",
+    "Ultrasound Initiative Chairman",
+    "Center of Family Love Support Chairman",
+    "Faith Director",
+    "Icons Chairman",
+    "Keep Christ in Christmas Chairman",
+    "RSVP Chairman - OKC",
+    "RSVP Chairman - Tulsa",
+    "Community Director",
+    "State Golf Tournament Chairman",
+    "Coats 4 Kids Chairman",
+    "State Free Throw Tournament Chairman",
+    "Soccer Challenge Chairman",
+    "Disaster Response Chairman",
+    "Family Director",
+    "Family of the Month Chairman",
+    "Food 4 Families Chairman"
+)
+ORDER BY
+CASE r.role COLLATE NOCASE
+    WHEN "State Program Director" THEN 1
+    WHEN "Life Director" THEN 2
+    WHEN "Silver Rose Chairman" THEN 3
+    WHEN "March 4 Life Chairman - OKC" THEN 4
+    WHEN "March 4 Life Chairman - Tulsa" THEN 5
+    WHEN "Intellectual Disabilities Chairman" THEN 6
+    WHEN "Special Olympics Chairman" THEN 7
+    WHEN "Ultrasound Initiative Chairman" THEN 8
+    WHEN "Center of Family Love Support Chairman" THEN 9
+    WHEN "Faith Director" THEN 10
+    WHEN "Icons Chairman" THEN 11
+    WHEN "Keep Christ in Christmas Chairman" THEN 12
+    WHEN "RSVP Chairman - OKC" THEN 13
+    WHEN "RSVP Chairman - Tulsa" THEN 14
+    WHEN "Community Director" THEN 15
+    WHEN "State Golf Tournament Chairman" THEN 16
+    WHEN "Coats 4 Kids Chairman" THEN 17
+    WHEN "State Free Throw Tournament Chairman" THEN 18
+    WHEN "Soccer Challenge Chairman" THEN 19
+    WHEN "Disaster Response Chairman" THEN 20
+    WHEN "Family Director" THEN 21
+    WHEN "Family of the Month Chairman" THEN 22
+    WHEN "Food 4 Families Chairman" THEN 23
+	WHEN "State Membership Growth Director" THEN 24
+	WHEN "State Online Coordinator" THEN 25
+	WHEN "State Roundtable Chairman" THEN 26
+    ELSE 99
+END;
+
+-- STATE OFFICERS VIEW
+DROP VIEW IF EXISTS "StateOfficerView";
+CREATE VIEW "StateOfficerView" AS 
+	select k.first_name || ' ' || k.last_name as "full_name",
+	k.wife as "wife",
+	k.address as "address",
+	k.city || ', ' || k.state || ' ' || k.zipcode as "city_state_zip",
+	k.primary_phone as "phone",
+	k.email as "email",
+	k.council as "council",
+	r.id as "role_id",
+	group_concat(r.role, ', ') as "role"
+from knights k
+
+left join knights_roles kr on k.id = kr.knight_id 
+left join roles r on kr.role_id = r.id
+left join councils c on k.council = c.id
+
+where role_id <=10 OR role_id=71
+group by k.id, k.first_name, k.last_name, k.email
+order by min(r.id);
+
+-- PAST STATE DEPUTIES VIEW
+DROP VIEW IF EXISTS "PastStateDeputyView";
+CREATE VIEW "PastStateDeputyView" AS
+SELECT
+	rt.term_start as "term_start",
+	rt.term_end as "term_end",
+	k.first_name || ' ' || k.last_name as "full_name",
+	k.wife as "wife",
+	k.address as "address",
+	k.city || ', ' || k.state || ' ' || k.zipcode as "city_state_zip",
+	k.primary_phone as "phone",
+	k.email as "email",
+	k.council as "council",
+	k.deceased as "deceased"
+FROM role_terms rt
+INNER JOIN knights k ON rt.knight_id = k.id
+WHERE rt.role_id = 2
+	AND rt.term_end IS NOT NULL
+	AND rt.term_end <= CAST(strftime('%Y', 'now') AS INTEGER)
+ORDER BY rt.term_start;
+
+-- COUNCILS VIEW
+-- Only created if missing so an existing hand-built definition is kept.
+-- Column order matches KnightsDirectoryGenerator._council_from_row
+CREATE VIEW IF NOT EXISTS "CouncilsView" AS
+SELECT
+	c.council_number as "number",
+	coalesce(c.council_name, '') || char(10) || coalesce(c.parish, '') || char(10) ||
+		coalesce(c.address, '') || char(10) || coalesce(c.city, '') as "address",
+	d.number as "district",
+	gk.first_name || ' ' || gk.last_name || char(10) || gk.address || char(10) ||
+		gk.city || ', ' || gk.state || ' ' || gk.zipcode as "gk_name",
+	gk.primary_phone as "gk_phone",
+	gk.email as "gk_email",
+	fs.first_name || ' ' || fs.last_name || char(10) || fs.address || char(10) ||
+		fs.city || ', ' || fs.state || ' ' || fs.zipcode as "fs_name",
+	fs.primary_phone as "fs_phone",
+	fs.email as "fs_email"
+FROM councils c
+LEFT JOIN districts d ON c.district_id = d.id
+LEFT JOIN knights gk ON c.gk_id = gk.id
+LEFT JOIN knights fs ON c.fs_id = fs.id;
@@ -0,0 +1,9 @@
+-- ROLE TERMS: ONE ROW PER KNIGHT, ROLE AND START YEAR
+-- Merging duplicate knights could leave the same term on a knight twice,
+-- which lists them twice in PastStateDeputyView. Drop any such duplicates
+-- (keeping the first row) before enforcing the key.
+DELETE FROM "role_terms"
+WHERE "id" NOT IN (
+	SELECT min("id") FROM "role_terms" GROUP BY "knight_id", "role_id", "term_start"
+);
+CREATE UNIQUE INDEX IF NOT EXISTS "idx_role_terms_knight_role_start" ON "role_terms" ("knight_id", "role_id", "term_start");
@@ -0,0 +1,132 @@
+"""
+Memory tests for FlowableStream
+
+Builds the same story at two sizes and checks that the traced peak of the
+streaming path stays flat while the list path grows with the row count, both
+for a synthetic story and for a whole directory built from a database.
+
+Usage:
+python -m pytest test_flowable_stream.py
+"""
+
+import contextlib
+import gc
+import io
+import sqlite3
+import tracemalloc
+
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Table
+
+import knights_database_generator
+from knights_database_generator import FlowableStream, KnightsDirectoryGenerator
+from knights_migrate import KnightsMigrator
+
+SMALL, LARGE = 100, 400
+CHUNK_SIZE = 40
+
+# Councils and districts in the two generated databases, and how much the
+# streaming build's peak may grow per extra one. Streaming grows by about
+# 450 bytes a row (the entry labels kept for knights_verify.py); a loader
+# that lists its rows up front costs about 2 KB a row.
+SMALL_DB, LARGE_DB = 50, 200
+MAX_BYTES_PER_ROW = 1024
+
+
+class DiscardingCanvas(Canvas):
+    """Canvas that drops each finished page, so only the story is measured
+
+    A real canvas keeps every page until save(), which grows with the page
+    count whether or not the story is streamed.
+    """
+
+    def showPage(self):
+        self._startPage()
+
+    def save(self):
+        pass
+
+
+def _story(rows):
+    """A directory-like story of one paragraph and one table per row"""
+    style = getSampleStyleSheet()['Normal']
+    for i in range(rows):
+        yield Paragraph(f"Knight {i} " + "x" * 200, style)
+        yield Table([[str(i), 'Grand Knight', '(405) 555-0100'],
+                     ['123 Main St', 'Oklahoma City, OK 73101', f"knight{i}@example.com"]])
+
+
+def _build_peak(rows, stream):
+    """Peak traced memory while building the story"""
+    doc = SimpleDocTemplate('unused.pdf')
+    tracemalloc.start()
+    try:
+        story = FlowableStream(_story(rows), CHUNK_SIZE) if stream else list(_story(rows))
+        doc.build(story, canvasmaker=DiscardingCanvas)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_stream_peak_does_not_grow_with_rows():
+    small = _build_peak(SMALL, stream=True)
+    large = _build_peak(LARGE, stream=True)
+    assert large < small * 1.25, f"peak grew from {small} to {large} bytes"
+
+
+def test_list_peak_grows_with_rows():
+    # Control: the measurement can see the story growing
+    small = _build_peak(SMALL, stream=False)
+    large = _build_peak(LARGE, stream=False)
+    assert large > small * 2, f"peak only grew from {small} to {large} bytes"
+
+
+def _make_db(path, rows):
+    """Migrated database with rows councils, each in its own district"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        KnightsMigrator(path).migrate()
+
+    conn = sqlite3.connect(path)
+    conn.executemany("INSERT INTO knights (id, first_name, last_name, address, city, state, zipcode, primary_phone, email, council) "
+                     "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                     [(i, f"First{i}", f"Last{i}", f"{i} Main St", 'Tulsa', 'Oklahoma', 74101,
+                       f"918555{i:04d}", f"knight{i}@example.com", i) for i in range(1, 2 * rows + 1)])
+    conn.executemany("INSERT INTO districts (id, number, dd_id) VALUES (?, ?, ?)",
+                     [(i, i, i) for i in range(1, rows + 1)])
+    conn.executemany("INSERT INTO councils (council_number, council_name, parish, address, city, district_id, gk_id, fs_id) "
+                     "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                     [(i, f"Council {i}", 'St. Joseph', '1 Church St', 'Tulsa', i, i, rows + i) for i in range(1, rows + 1)])
+    conn.commit()
+    conn.close()
+
+
+def _directory_peak(db_path, output_base):
+    """Peak traced memory while streaming a whole directory from db_path"""
+    generator = KnightsDirectoryGenerator(db_path, 'no_logo.png')
+    gc.collect()
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            generator.generate_document(output_base, stream=True, chunk_size=CHUNK_SIZE)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_directory_stream_peak_does_not_grow_with_rows(tmp_path, monkeypatch):
+    class DiscardingDocTemplate(knights_database_generator.DirectoryDocTemplate):
+        def build(self, flowables, **kwargs):  # pylint: disable=arguments-differ
+            return super().build(flowables, canvasmaker=DiscardingCanvas)
+
+    monkeypatch.setattr(knights_database_generator, 'DirectoryDocTemplate', DiscardingDocTemplate)
+
+    peaks = []
+    for rows in (SMALL_DB, LARGE_DB):
+        db_path = str(tmp_path / f"knights_{rows}.db")
+        _make_db(db_path, rows)
+        peaks.append(_directory_peak(db_path, str(tmp_path / 'directory')))
+
+    small, large = peaks
+    assert large - small < (LARGE_DB - SMALL_DB) * MAX_BYTES_PER_ROW, \
+        f"peak grew from {small} to {large} bytes"
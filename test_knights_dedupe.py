@@ -0,0 +1,93 @@
+"""
+Tests for knights_dedupe.py
+
+Usage:
+python -m pytest test_knights_dedupe.py
+"""
+
+import contextlib
+import io
+import sqlite3
+
+import pytest
+
+from knights_dedupe import KnightsDeduplicator
+from knights_migrate import KnightsMigrator
+
+KNIGHT_COLUMNS = ['id', 'first_name', 'middle_name', 'last_name', 'address', 'city',
+                  'primary_phone', 'email', 'council']
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Empty database at the current schema"""
+    path = str(tmp_path / 'knights.db')
+    with contextlib.redirect_stdout(io.StringIO()):
+        KnightsMigrator(path).migrate()
+    return path
+
+
+def _insert_knights(db_path, *knights):
+    conn = sqlite3.connect(db_path)
+    conn.executemany(f"INSERT INTO knights ({', '.join(KNIGHT_COLUMNS)}) VALUES ({', '.join('?' * len(KNIGHT_COLUMNS))})",
+                     [[knight.get(column) for column in KNIGHT_COLUMNS] for knight in knights])
+    conn.commit()
+    conn.close()
+
+
+def _knight(knight_id, **fields):
+    return {'id': knight_id, 'first_name': 'John', 'last_name': 'Smith', 'address': '1 Main St',
+            'city': 'Tulsa', 'primary_phone': '918-555-0100', 'council': 1234, **fields}
+
+
+def _groups(db_path):
+    return [[group['keep']['id'], *(k['id'] for k in group['merge'])]
+            for group in KnightsDeduplicator(db_path).find_duplicates()]
+
+
+def test_identical_records_without_email_are_duplicates(db_path):
+    _insert_knights(db_path, _knight(1), _knight(2))
+    assert _groups(db_path) == [[1, 2]]
+    assert KnightsDeduplicator(db_path).score(_knight(1, middle_name=None, email=None, secondary_phone=None),
+                                              _knight(2, middle_name=None, email=None, secondary_phone=None)) == 1.0
+
+
+def test_relatives_with_different_emails_are_not_duplicates(db_path):
+    _insert_knights(db_path, _knight(1, email='john@example.com'), _knight(2, email='johnjr@example.com'))
+    assert not _groups(db_path)
+
+
+def test_different_suffixes_are_not_duplicates(db_path):
+    _insert_knights(db_path, _knight(1, last_name='Smith Sr.'), _knight(2, last_name='Smith Jr.'))
+    assert not _groups(db_path)
+
+
+def test_record_without_middle_name_does_not_chain_different_people(db_path):
+    _insert_knights(db_path,
+                    _knight(1, middle_name='Adam', email='smith@example.com'),
+                    _knight(2, email='smith@example.com'),
+                    _knight(3, middle_name='Bert', email='smith@example.com'))
+
+    groups = _groups(db_path)
+    assert len(groups) == 1
+    assert not {1, 3} <= set(groups[0])
+
+
+def test_merge_keeps_one_copy_of_each_role_term(db_path):
+    _insert_knights(db_path, _knight(1), _knight(2))
+    conn = sqlite3.connect(db_path)
+    # Both copies carry the 2000-2002 term; only the duplicate has 2010-2012
+    conn.executemany("INSERT INTO role_terms (knight_id, role_id, term_start, term_end) VALUES (?, 2, ?, ?)",
+                     [(1, 2000, 2002), (2, 2000, 2002), (2, 2010, 2012)])
+    conn.commit()
+
+    deduplicator = KnightsDeduplicator(db_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        deduplicator.merge(deduplicator.find_duplicates())
+
+    terms = conn.execute("SELECT knight_id, term_start FROM role_terms ORDER BY term_start").fetchall()
+    past_state_deputies = conn.execute("SELECT term_start, full_name FROM PastStateDeputyView ORDER BY term_start").fetchall()
+    conn.close()
+
+    assert terms == [(1, 2000), (1, 2010)]
+    assert past_state_deputies == [(2000, 'John Smith'), (2010, 'John Smith')]